@@ -1,40 +1,48 @@
 
 import argparse
+import itertools
 import re
 import sys
+from collections.abc import Iterable
 
 # These patterns are from the original file-patterns.sh script.
 PACKAGE_PATTERNS = [
-    re.compile(r"^statscan/"),
-    re.compile(r"^pyproject\.toml$"),
-    re.compile(r"^setup\.py$"),
-    re.compile(r"^requirements.*\.txt$"),
-    re.compile(r"^README\.md$"),
-    re.compile(r"^LICENSE$"),
+    r"statscan/",
+    r"pyproject\.toml$",
+    r"setup\.py$",
+    r"requirements.*\.txt$",
+    r"README\.md$",
+    r"LICENSE$",
 ]
 
 INFRASTRUCTURE_PATTERNS = [
-    re.compile(r"^\.github/"),
-    re.compile(r"^docs/"),
-    re.compile(r"^tools/"),
-    re.compile(r"^examples/"),
-    re.compile(r"^scratch/"),
-    re.compile(r"^tests/.*\.py$"),
+    r"\.github/",
+    r"docs/",
+    r"tools/",
+    r"examples/",
+    r"scratch/",
+    r"tests/.*\.py$",
 ]
 
-def should_trigger_package_operations(changed_files):
+# Each pattern group is fused into a single anchored alternation so that a file
+# is classified with at most two regex calls.
+_PKG_RE = re.compile(rf"^(?:{'|'.join(PACKAGE_PATTERNS)})")
+_INFRA_RE = re.compile(rf"^(?:{'|'.join(INFRASTRUCTURE_PATTERNS)})")
+
+def should_trigger_package_operations(changed_files: Iterable[str]) -> bool:
     """
     Determines if the changed files should trigger package operations.
+    The iterable is consumed lazily and iteration stops at the first package-relevant file.
     """
     for file in changed_files:
         if not file:
             continue
 
-        if any(pattern.match(file) for pattern in PACKAGE_PATTERNS):
+        if _PKG_RE.match(file):
             print(f"  ✅ Package-relevant file found: {file}", file=sys.stderr)
             return True
 
-        if any(pattern.match(file) for pattern in INFRASTRUCTURE_PATTERNS):
+        if _INFRA_RE.match(file):
             print(f"  ⏭️  Infrastructure file: {file}", file=sys.stderr)
             continue
 
@@ -49,20 +57,17 @@ if __name__ == "__main__":
     parser.add_argument("files", nargs="*", help="List of changed files from stdin.")
     args = parser.parse_args()
 
-    files_to_check = []
-    if not sys.stdin.isatty():
-        files_to_check.extend(line.strip() for line in sys.stdin)
-
-    if args.files:
-        files_to_check.extend(args.files)
+    stdin_files = (line.strip() for line in sys.stdin) if not sys.stdin.isatty() else ()
+    files_to_check = itertools.chain(stdin_files, args.files)
 
-    if not files_to_check:
-        print("false")
-        sys.exit(0)
+    triggered = should_trigger_package_operations(files_to_check)
 
+    # Drain any stdin left after an early stop so the upstream writer does not
+    # fail with a broken pipe (e.g. under `set -o pipefail`)
+    for _ in stdin_files:
+        pass
 
-    if should_trigger_package_operations(files_to_check):
+    if triggered:
         print("true")
     else:
         print("false")
-
@@ -5,6 +5,7 @@ import re
 
 CHANGELOG_PATH = "CHANGELOG.md"
 UNRELEASED_HEADER = "## [Unreleased]"
+_UNRELEASED_RE = re.compile(rf"^{re.escape(UNRELEASED_HEADER)}", re.MULTILINE)
 CHANGELOG_TEMPLATE = f"# Changelog\n\nAll notable changes to this project will be documented in this file.\n\nThe format is based on [Keep a Changelog](https://keepachangelog.com/en/1.0.0/),\nand this project adheres to [Semantic Versioning](https://semver.org/spec/v2.0.0.html).\n\n{UNRELEASED_HEADER}\n"
 
 def update_changelog(pr_number, pr_title, pr_author, pr_url):
@@ -20,20 +21,22 @@ def update_changelog(pr_number, pr_title, pr_author, pr_url):
             f.write(f"\n{entry}\n")
         return
 
-    with open(CHANGELOG_PATH, "r+") as f:
-        content = f.read()
+    with open(CHANGELOG_PATH, "rb") as f:
+        content = f.read().decode()
 
-        if f"([#{pr_number}]" in content:
-            print(f"Entry for PR #{pr_number} already exists in changelog.")
-            return
+    if f"([#{pr_number}]" in content:
+        print(f"Entry for PR #{pr_number} already exists in changelog.")
+        return
 
-        unreleased_match = re.search(r"^## [Unreleased]", content, re.MULTILINE)
+    unreleased_match = _UNRELEASED_RE.search(content)
 
+    # Only reopen for writing once we know an update is required
+    with open(CHANGELOG_PATH, "r+b") as f:
         if unreleased_match:
+            # Only the bytes after the [Unreleased] header are rewritten; the prefix stays in place.
             insert_pos = unreleased_match.end()
-            new_content = content[:insert_pos] + f"\n\n{entry}" + content[insert_pos:]
-            f.seek(0)
-            f.write(new_content)
+            f.seek(len(content[:insert_pos].encode()))
+            f.write(f"\n\n{entry}{content[insert_pos:]}".encode())
             print("Added entry to changelog.")
         else:
             # This case should be rare if the file is created from the template
@@ -42,7 +45,7 @@ def update_changelog(pr_number, pr_title, pr_author, pr_url):
             # A more robust solution could be to find the first `##` and insert before it.
             new_content = CHANGELOG_TEMPLATE + f"\n{entry}\n\n" + content
             f.seek(0)
-            f.write(new_content)
+            f.write(new_content.encode())
 
 
 if __name__ == "__main__":
@@ -2,6 +2,8 @@ import sys
 import re
 from datetime import datetime
 
+_UNRELEASED_CI_RE = re.compile(r'## \[UNRELEASED\]', re.IGNORECASE)
+
 def update_changelog(version):
     """
     Updates the CHANGELOG.md file by replacing the '[UNRELEASED]' section
@@ -11,15 +13,14 @@ def update_changelog(version):
         with open('CHANGELOG.md', 'r') as f:
             content = f.read()
 
-        unreleased_pattern = re.compile(r'## \[UNRELEASED\]', re.IGNORECASE)
         today = datetime.now().isoformat()
         release_header = f'## [{version}] - {today}'
 
-        if not unreleased_pattern.search(content):
+        if not _UNRELEASED_CI_RE.search(content):
             print("Error: '## [UNRELEASED]' section not found in CHANGELOG.md.")
             sys.exit(1)
 
-        new_content = unreleased_pattern.sub(release_header, content, count=1)
+        new_content = _UNRELEASED_CI_RE.sub(release_header, content, count=1)
 
         with open('CHANGELOG.md', 'w') as f:
             f.write(new_content)
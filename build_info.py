@@ -1,14 +1,18 @@
 # This file provides basic mappings for the build process
+import functools
 import os
+import re
+import subprocess  # nosec B404
 import sys
-from typing import Optional, Self, ClassVar, Any, Union, get_args, get_origin
+import types
+from collections.abc import Callable
+from typing import Optional, Self, ClassVar, Any, Union, get_args, get_origin, get_type_hints
 from pathlib import Path
 from datetime import datetime, timezone
-from dataclasses import dataclass, field, fields, asdict, Field
+from dataclasses import dataclass, field, fields, Field
 from enum import StrEnum, auto
 import json
 import logging
-import tomllib
 
 
 logger = logging.getLogger(name=__name__)
@@ -17,6 +21,20 @@ _GIT_DIR_NAME: str = ".git"
 _PYPROJECT_FILE_NAME: str = "pyproject.toml"
 DEFAULT_VERSION_FILE_NAME: str = "_version.py"
 DEFAULT_REPOSITORY_PATH: Path = Path.cwd()
+_SCRIPT_NAME: str = Path(__file__).name
+_VERSION_STR_RE = re.compile(
+    r"^(?P<year>\d{4})\.(?P<month>\d{1,2})\.(?P<day>\d{1,2})\.(?P<hour>\d{2})(?P<minute>\d{2})(?P<second>\d{2})$"
+)
+# matches the `__name__: type = 'value'` assignments emitted by BuildInfo.write_version_file
+_VERSION_FILE_RE = re.compile(
+    r"""^__(?P<key>\w+)__\s*:\s*(?P<type>\w+)\s*=\s*['"](?P<val>[^'"]*)['"]""", re.MULTILINE
+)
+_VERSION_FILE_TYPES: dict[str, Any] = {
+    "str": str,
+    "int": int,
+    "float": float,
+    "bool": lambda v: v.lower() in ("true", "1"),
+}
 
 
 class GitHubActionEnvVars(StrEnum):
@@ -52,24 +70,37 @@ class GitHubActionEnvVars(StrEnum):
 def print_dir_contents(path: Path, level: int = 0, max_level: int = 1) -> None:
     """
     Print the contents of a directory.
+    Walks the tree depth-first with os.scandir and an explicit stack of open iterators,
+    reusing the cached DirEntry type/stat information instead of building Path objects.
     Args:
         path (Path): The path to the directory.
-        level (int): The current level of recursion.
+        level (int): The starting indentation level.
+        max_level (int): The deepest level to descend into.
     """
     print(f"{'  ' * level}{path}/")
-    for item in path.iterdir():
-        if item.is_dir():
-            if level >= max_level:
-                print(f"{'  ' * (level + 1)}- {item.name}/ (max level reached)")
+    stack = [(os.scandir(path), level)]
+    try:
+        while stack:
+            it, lvl = stack[-1]
+            if (entry := next(it, None)) is None:
+                it.close()
+                stack.pop()
                 continue
+            indent = "  " * (lvl + 1)
+            if entry.is_dir(follow_symlinks=False):
+                if lvl >= max_level:
+                    print(f"{indent}- {entry.name}/ (max level reached)")
+                else:
+                    print(f"{indent}{entry.path}/")
+                    stack.append((os.scandir(entry.path), lvl + 1))
             else:
-                print_dir_contents(item, level + 1, max_level)
-                continue
-        else:
-            print(f"{'  ' * (level + 1)}- {item.name} ({item.stat().st_size} bytes)")
-            continue
+                print(f"{indent}- {entry.name} ({entry.stat().st_size} bytes)")
+    finally:
+        for it, _ in stack:
+            it.close()
 
 
+@functools.cache
 def get_head_ref_path(git_path: Path) -> Path:
     """
     Get the current git HEAD reference.
@@ -81,20 +112,19 @@ def get_head_ref_path(git_path: Path) -> Path:
     # git_path default is repo root .git directory; try repo_dir or cwd
     head_path = git_path / "HEAD"
 
-    if not head_path.exists():
+    try:
+        # HEAD is a single short line, e.g. "ref: refs/heads/main"
+        content = head_path.read_text()
+    except FileNotFoundError:
         raise FileNotFoundError(
             f'HEAD file path "{head_path.resolve()}" not found. Please ensure you are in a valid git repository.'
-        )
+        ) from None
 
-    ref: Optional[str] = None
-    with head_path.open() as f:
-        for line in f.readlines():
-            if line.startswith("ref:"):
-                # Extract the reference path from the line
-                ref = line.split(":", 1)[1].strip()
-                break
-    if ref is None:
+    _, sep, rest = content.partition("ref:")
+    if not sep:
         raise ValueError(f"No reference found in HEAD file at {head_path.resolve()}.")
+    # Extract the reference path from the line
+    ref = rest.split("\n", 1)[0].strip()
 
     ref_path = git_path / ref
     if not ref_path.exists():
@@ -113,23 +143,79 @@ def get_commit_hash(repo_path: Optional[Path] = None) -> tuple[str, str]:
     Returns:
         tuple[str, str]: The current git branch name and commit hash.
     """
-    repo_path = repo_path or Path.cwd()
-    git_path = repo_path / _GIT_DIR_NAME
+    return _get_commit_hash(repo_path=(repo_path or Path.cwd()).resolve())
 
-    if not git_path.exists():
-        raise FileNotFoundError(
-            f"Git repository not found in {git_path.resolve()}. Please ensure you are in a valid git repository."
-        )
 
+def resolve_commit(repo_path: Optional[Path] = None) -> tuple[str, str]:
+    """
+    Get the current branch name and commit hash, preferring the GitHub Actions environment.
+    Git metadata is only read when GITHUB_REF or GITHUB_SHA is unset (or empty), so CI builds
+    never touch the repository files.
+    Returns:
+        tuple[str, str]: The current branch name and commit hash.
+    """
+    branch = GitHubActionEnvVars.GITHUB_REF.env_value
+    commit = GitHubActionEnvVars.GITHUB_SHA.env_value
+    if branch and commit:
+        logger.info("Using GitHub Actions environment variables for commit and branch")
+        return branch, commit
+    logger.info("Retrieving commit and branch from git repository")
+    git_branch, git_commit = get_commit_hash(repo_path=repo_path)
+    return branch or git_branch, commit or git_commit
+
+
+def _from_git_cmd(repo_path: Path) -> tuple[str, str]:
+    """
+    Get the current git branch name and commit hash using a single `git rev-parse` call.
+    Handles packed refs, worktrees and detached HEAD states.
+    Raises:
+        FileNotFoundError: If git is not available on PATH.
+        subprocess.CalledProcessError: If the path is not a git repository.
+    """
+    result = subprocess.run(  # nosec B603 B607
+        ["git", "-C", str(repo_path), "rev-parse", "HEAD", "--abbrev-ref", "HEAD"],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    commit, branch = result.stdout.split()
+    return branch, commit
+
+
+def _from_git_files(git_path: Path) -> tuple[str, str]:
+    """
+    Get the current git branch name and commit hash from the HEAD and loose ref files.
+    Raises:
+        FileNotFoundError: If the ref is packed (or HEAD is missing).
+        ValueError: If HEAD is detached.
+    """
     git_ref_path = get_head_ref_path(git_path=git_path)
 
     with git_ref_path.open() as f:
         commit = f.read().strip()
-    
+
     ref = git_ref_path.relative_to(git_path / 'refs/heads/')
     return str(ref), commit
 
 
+@functools.cache
+def _get_commit_hash(repo_path: Path) -> tuple[str, str]:
+    """Cached implementation of get_commit_hash, keyed on the resolved repository path."""
+    git_path = repo_path / _GIT_DIR_NAME
+
+    if not git_path.exists():
+        raise FileNotFoundError(
+            f"Git repository not found in {git_path.resolve()}. Please ensure you are in a valid git repository."
+        )
+
+    try:
+        return _from_git_files(git_path=git_path)
+    except (FileNotFoundError, NotADirectoryError, ValueError) as e:
+        # packed refs, detached HEAD or a worktree's .git file: let git resolve it
+        logger.debug(f"Reading {_GIT_DIR_NAME} files failed ({e}), falling back to git rev-parse")
+    return _from_git_cmd(repo_path=repo_path)
+
+
 def get_utc_timestamp() -> datetime:
     """Get the current UTC timestamp."""
     return datetime.now(tz=timezone.utc)
@@ -137,23 +223,18 @@ def get_utc_timestamp() -> datetime:
 def get_version_str(dt: Optional[datetime]) -> str:
     """Create or convert a datetime to a version string of the form YYYY.M.D.HHMMSS."""
     dt = dt or get_utc_timestamp()
-    return f"{dt.year}.{dt.month}.{dt.day}.{dt.hour:02d}{dt.minute:02d}{dt.second:02d}"
+    # month/day have no leading zeros, which strftime cannot express portably
+    return f"{dt.year}.{dt.month}.{dt.day}.{dt.strftime('%H%M%S')}"
 
 def version_str_to_datetime(version: str) -> datetime:
-
-    year, month, day, time_part = version.split(".")
-    hour = int(time_part[0:2])
-    minute = int(time_part[2:4])
-    second = int(time_part[4:6])
-    return datetime(
-        year=int(year),
-        month=int(month),
-        day=int(day),
-        hour=hour,
-        minute=minute,
-        second=second,
-        tzinfo=timezone.utc
-    )
+    """
+    Convert a version string of the form YYYY.M.D.HHMMSS back to a UTC datetime.
+    Raises:
+        ValueError: If the version string is not in the expected format.
+    """
+    if (m := _VERSION_STR_RE.match(version)) is None:
+        raise ValueError(f"Invalid version string: {version!r}. Expected format YYYY.M.D.HHMMSS")
+    return datetime(**{k: int(v) for k, v in m.groupdict().items()}, tzinfo=timezone.utc)
 
 def get_pyproject(repo_path: Path) -> dict[str, Any]:
     """
@@ -163,6 +244,14 @@ def get_pyproject(repo_path: Path) -> dict[str, Any]:
     Returns:
         dict: The parsed pyproject.toml content.
     """
+    return _get_pyproject(repo_path=Path(repo_path).resolve())
+
+
+@functools.cache
+def _get_pyproject(repo_path: Path) -> dict[str, Any]:
+    """Cached implementation of get_pyproject, keyed on the resolved repository path."""
+    import tomllib  # deferred: only needed when pyproject.toml is actually read
+
     pyproject_path = repo_path / _PYPROJECT_FILE_NAME
     if not pyproject_path.exists():
         raise FileNotFoundError(f"pyproject.toml not found at {pyproject_path.resolve()}")
@@ -170,6 +259,27 @@ def get_pyproject(repo_path: Path) -> dict[str, Any]:
         return tomllib.load(f)
 
 
+@functools.cache
+def _read_version_file(file_path: Path, mtime_ns: int, size: int) -> dict[str, Any]:
+    """
+    Parse the `__name__: type = 'value'` assignments of a version file in a single regex scan.
+    Cached on the file's (path, mtime, size) signature, so rewriting the file invalidates the entry.
+    The returned mapping (name -> typed value) is shared between callers and must not be modified.
+    """
+    return {
+        m["key"]: _VERSION_FILE_TYPES.get(m["type"], str)(m["val"])
+        for m in _VERSION_FILE_RE.finditer(file_path.read_text())
+    }
+
+
+def clear_caches() -> None:
+    """Clear the cached git, pyproject and version file lookups (e.g. between tests or after a new commit)."""
+    get_head_ref_path.cache_clear()
+    _get_commit_hash.cache_clear()
+    _get_pyproject.cache_clear()
+    _read_version_file.cache_clear()
+
+
 class BuildInfoEncoder(json.JSONEncoder):
     def default(self, obj: Any) -> Any:
         if isinstance(obj, datetime):
@@ -182,6 +292,11 @@ class BuildInfoEncoder(json.JSONEncoder):
 @dataclass
 class BuildInfo:
     SUPPORTED_TYPES: ClassVar = (int, float, str, bool)
+    _FIELDS: ClassVar[tuple[Field, ...]]  # populated after the class body
+    _FIELD_NAMES: ClassVar[tuple[str, ...]]  # populated after the class body
+    _FILE_FIELDS: ClassVar[tuple[Field, ...]]  # fields stored in the version file; populated after the class body
+    _CONVERTERS: ClassVar[dict[str, Callable[[Any], Any]]]  # field name -> value converter; populated after the class body
+    _PROP_NAMES: ClassVar[tuple[str, ...]]  # populated after the class body
     repo_path: Path
     build_time: datetime = field(
         default_factory=get_utc_timestamp
@@ -192,18 +307,14 @@ class BuildInfo:
     def __post_init__(self) -> None:
         if not isinstance(self.repo_path, Path):
             self.repo_path = Path(self.repo_path)
+        # Only resolve from the environment/git when something is missing (loading from a
+        # version file supplies both), and never overwrite an explicitly given value
         if None in (self.commit, self.branch):
-            commit = GitHubActionEnvVars.GITHUB_SHA.env_value
-            branch = GitHubActionEnvVars.GITHUB_REF.env_value
-            if all([commit, branch]):
-                logger.info("Using GitHub Actions environment variables for commit and branch")
-                self.commit = commit
-                self.branch = branch
-            else:
-                logger.info("Retrieving commit and branch from git repository")
-                self.branch, self.commit = get_commit_hash(repo_path=self.repo_path)
+            branch, commit = resolve_commit(repo_path=self.repo_path)
+            self.commit = self.commit or commit
+            self.branch = self.branch or branch
 
-    @property  # type: ignore[no-redef]
+    @functools.cached_property
     def version(self) -> Optional[str]:
         if self.build_time:
             return get_version_str(dt=self.build_time)
@@ -211,131 +322,83 @@ class BuildInfo:
             return None
 
     def update_commit_hash_from_repo(self):
-        self.commit = get_commit_hash(repo_path=self.repo_path)
+        self.branch, self.commit = resolve_commit(repo_path=self.repo_path)
 
     @classmethod
     def from_version_file(cls, file_path: Path) -> Self:
         """
         Load version information from a file.
-        Raises ValueError if any required fields are missing from the file.
+        The file is parsed (not executed); repeat loads of an unchanged file reuse the cached result.
         """
-        kwargs: dict[str, Any] = {}
-
-        cls_fields: dict[str, Field] = {f.name: f for f in fields(cls)}
-
-        with file_path.open(mode="r") as f:
-            for line in f:
-                if line.startswith("#"):
-                    continue
-                if "=" not in line:
-                    continue
-
-                v_type = None
-                key: str
-                value_str: str
-                key, value_str = line.split("=", 1)  # Split only on first =
-
-                if len(key_type := key.split(":")) > 1:
-                    if len(key_type) > 2:
-                        raise ValueError(
-                            f"Cannot parse key: {key_type[0]}. {key_type=}"
-                        )
-                    for t in cls.SUPPORTED_TYPES:
-                        if key_type[1].strip() == t.__name__:
-                            v_type = t
-                            break
-                    key = key_type[0]
-
-                key = key.strip()
-
-                if key.startswith("__") and key.endswith("__"):
-                    key = key[2:-2]
-
-                if (fld := cls_fields.get(key, None)) is not None:
-                    value: Any
-                    value_str = (
-                        value_str.split("#")[0]
-                        .strip()
-                        .replace("'", "")
-                        .replace('"', "")
-                    )
-
-                    # check if the field type is a union
-                    if get_origin(fld.type) is Union:
-                        # If it's a Union, we need to check the types inside it
-                        fld_types = get_args(fld.type)
-                    else:
-                        fld_types = (fld.type,)
-                    if v_type is not None:
-                        if v_type in cls.SUPPORTED_TYPES:
-                            if v_type is bool:
-                                if value_str.lower() in ("true", "1"):
-                                    value = True
-                                elif value_str.lower() in ("false", "0"):
-                                    value = False
-                                else:
-                                    raise ValueError(
-                                        f"Invalid boolean value for key {key}: {value_str}"
-                                    )
-                            else:
-                                value = v_type(value_str)
-                        else:
-                            raise TypeError(
-                                f"Unsupported type {v_type} for key {key}. Supported types are: {cls.SUPPORTED_TYPES}"
-                            )
-
-                    if v_type in fld_types:
-                        kwargs[key] = value
-                        continue
-                    elif (datetime in fld_types) and isinstance(value, str):
-                        kwargs[key] = datetime.fromisoformat(value)
-                        continue
+        st = file_path.stat()
+        values = _read_version_file(file_path.resolve(), st.st_mtime_ns, st.st_size)
+
+        kwargs: dict[str, Any] = {
+            name: convert(value)
+            for name, convert in cls._CONVERTERS.items()
+            if (value := values.get(name)) is not None
+        }
         return cls(repo_path=file_path.parent, **kwargs)
 
-    def write_version_file(self, version_file: Optional[Path] = None) -> Path:
+    def write_version_file(self, version_file: Optional[Path] = None) -> bool:
         """
         Write the version number and build metadata to a file.
+        The file is left untouched (mtime preserved) if its content would not change.
+
+        Returns:
+            bool: True if the file was written, False if its content was already current.
         """
         version_file = version_file or (self.repo_path / DEFAULT_VERSION_FILE_NAME)
-        with open(file=version_file, mode="w") as f:
-            f.write(f"# This file is automatically generated by ../{Path(__file__).name} \n")
-            f.write(f"__version__: str = '{self.version}'\n")
-            for fld in fields(self):
-                if fld.name == "repo_path":
-                    continue  # repo_path is derived from the version file path
-                v = getattr(self, fld.name)
-                if isinstance(v, datetime):
-                    v = v.isoformat()
-                if isinstance(v, self.SUPPORTED_TYPES):
-                    f.write(f"__{fld.name}__: {type(v).__name__} = '{str(v)}'\n")
-                else:
-                    f.write(f" # {fld.name}: {fld.type} = {v}\n")
-        return version_file
+        lines: list[str] = [
+            f"# This file is automatically generated by ../{_SCRIPT_NAME} \n",
+            f"__version__: str = '{self.version}'\n",
+        ]
+        for fld in self._FILE_FIELDS:
+            v = getattr(self, fld.name)
+            if isinstance(v, datetime):
+                v = v.isoformat()
+            if isinstance(v, self.SUPPORTED_TYPES):
+                lines.append(f"__{fld.name}__: {type(v).__name__} = '{str(v)}'\n")
+            else:
+                lines.append(f" # {fld.name}: {fld.type} = {v}\n")
+        new_bytes = "".join(lines).encode()
+
+        if version_file.exists() and version_file.read_bytes() == new_bytes:
+            logger.info(f"Version file {version_file} content unchanged, skipping write.")
+            return False
+        version_file.write_bytes(new_bytes)
+        return True
 
     def to_dict(self) -> dict[str, Any]:
-        d = asdict(self)
-        # add props to dict
-        for k, v in self.__class__.__dict__.items():
-            if isinstance(v, property):
-                d[k] = getattr(self, k)
-        return d
+        # flat fields only, so a shallow build avoids asdict's recursive deepcopy
+        return {
+            k: getattr(self, k)
+            for k in (*self._FIELD_NAMES, *self._PROP_NAMES)
+        }
 
     def to_json(self) -> str:
         d = self.to_dict()
         return json.dumps(d, indent=2, skipkeys=True, cls=BuildInfoEncoder)
 
-    def update_version_file(self, version_file: Path) -> bool:
+    def update_version_file(self, version_file: Path, force: bool = False) -> bool:
         """
         Update the version file with the current version information.
-        If the commit hash matches the existing file, no update is performed.
+        If the commit and branch match the existing file, no update is performed
+        (a differing build_time alone does not trigger a rewrite) unless `force` is set.
 
         Returns:
-            bool: True if the file was updated, False if no update was needed.
+            bool: True if the file was rewritten, False if no update was needed (including a
+            forced update whose content is unchanged).
         """
-        bi = self.from_version_file(file_path=version_file) if version_file.exists() else None
+        try:
+            # from_version_file is cached on the file's stat signature, so an unchanged
+            # file costs a single stat here
+            bi = self.from_version_file(file_path=version_file)
+        except FileNotFoundError:
+            bi = None
 
         if bi:
-            if self.commit == bi.commit:
+            if not force and (self.commit, self.branch) == (bi.commit, bi.branch):
                 logger.info(f"Version file {version_file} is up to date.")
                 return False
             else:
@@ -344,8 +407,30 @@ class BuildInfo:
             logger.info(
                 f"Version file {version_file} does not exist. Creating new version file."
             )
-        self.write_version_file(version_file=version_file)
-        return True
+        return self.write_version_file(version_file=version_file)
+
+
+BuildInfo._FIELDS = fields(BuildInfo)
+BuildInfo._FIELD_NAMES = tuple(fld.name for fld in BuildInfo._FIELDS)
+# repo_path is derived from the version file's location, so it is never stored in it
+BuildInfo._FILE_FIELDS = tuple(fld for fld in BuildInfo._FIELDS if fld.name != "repo_path")
+
+
+def _field_converter(tp: Any) -> Callable[[Any], Any]:
+    """Resolve a field annotation to the callable that converts a version file value to it."""
+    if get_origin(tp) in (Union, types.UnionType):  # Optional[X] / X | None -> X
+        tp = next(arg for arg in get_args(tp) if arg is not type(None))
+    if tp is datetime:
+        return lambda v: v if isinstance(v, datetime) else datetime.fromisoformat(v)
+    return tp
+
+
+_hints = get_type_hints(BuildInfo)
+BuildInfo._CONVERTERS = {fld.name: _field_converter(_hints[fld.name]) for fld in BuildInfo._FILE_FIELDS}
+del _hints
+BuildInfo._PROP_NAMES = tuple(
+    k for k, v in vars(BuildInfo).items() if isinstance(v, (property, functools.cached_property))
+)
 
 
 if __name__ == "__main__":
@@ -407,6 +492,11 @@ if __name__ == "__main__":
         type=datetime.fromisoformat,
         help="The build time (iso-8601 format) to include in the version file.",
     )
+    create_group.add_argument(
+        "--force",
+        action="store_true",
+        help="Rewrite the version file on update even if the commit and branch are unchanged.",
+    )
     create_group.add_argument(
         "--dry-run",
         action="store_true",
@@ -494,8 +584,10 @@ if __name__ == "__main__":
             if args.dry_run:
                 logger.info(f"Dry run: would create new version file at: {version_file}")
             else:
-                fp = bi.write_version_file(version_file=version_file)
-                logger.info(f"Created new version file at: {fp}")
+                if bi.write_version_file(version_file=version_file):
+                    logger.info(f"Created new version file at: {version_file}")
+                else:
+                    logger.info(f"Version file at {version_file} already up to date")
         else:
             bi = BuildInfo.from_version_file(file_path=version_file)
 
@@ -504,10 +596,11 @@ if __name__ == "__main__":
                 bi.commit = args.commit
             if args.build_time:
                 bi.build_time = args.build_time
+                bi.__dict__.pop("version", None)  # invalidate the cached version string
             if args.dry_run:
                 logger.info(f"Dry run: would update version file at: {version_file}")
             else:
-                if bi.update_version_file(version_file=version_file):
+                if bi.update_version_file(version_file=version_file, force=args.force):
                     logger.info(f"Updated version file at: {version_file}")
                 else:
                     logger.info(f"No update needed for version file at: {version_file}")
@@ -0,0 +1,30 @@
+"""
+Shared WDS client factory for the examples.
+
+The examples issue many small requests to the same host, so their clients keep
+idle connections alive and reuse sockets instead of repeating TCP/TLS setup.
+HTTP/2 is used when the optional h2 package is installed.
+"""
+
+import importlib.util
+
+from httpx import AsyncHTTPTransport, Limits, Timeout
+
+from statscan.wds.client import DEFAULT_WDS_TIMEOUT, Client
+
+# Connection pool sized for concurrent sweeps; idle connections are kept alive
+# so consecutive requests reuse sockets
+POOL_LIMITS = Limits(
+    max_connections=50, max_keepalive_connections=20, keepalive_expiry=30.0
+)
+
+# HTTP/2 requires the optional h2 package (pip install httpx[http2])
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+def create_client(timeout: Timeout = DEFAULT_WDS_TIMEOUT) -> Client:
+    """Create a WDS client with a tuned, keep-alive connection pool."""
+    transport = AsyncHTTPTransport(
+        limits=POOL_LIMITS, http2=HTTP2_AVAILABLE, retries=2
+    )
+    return Client(timeout=timeout, transport=transport)
@@ -0,0 +1,28 @@
+"""
+Shared cube metadata memoizer for the WDS examples.
+
+Cube metadata does not change during a run, so the examples fetch it once per
+product ID. Only successful lookups are cached; a failed request raises to the
+caller and the next lookup tries again.
+"""
+
+import asyncio
+
+from statscan.wds.client import Client
+from statscan.wds.models.cube import Cube
+
+# In-process cache of cube metadata, keyed by product ID
+_METADATA_CACHE: dict[int, Cube] = {}
+# Per-product locks so concurrent callers share one request instead of racing
+_METADATA_LOCKS: dict[int, asyncio.Lock] = {}
+
+
+async def cached_get_cube_metadata(client: Client, product_id: int) -> Cube:
+    """Fetch cube metadata once per product ID; repeat lookups are served from memory."""
+    if (metadata := _METADATA_CACHE.get(product_id)) is not None:
+        return metadata
+    async with _METADATA_LOCKS.setdefault(product_id, asyncio.Lock()):
+        if (metadata := _METADATA_CACHE.get(product_id)) is None:
+            metadata = await client.get_cube_metadata(product_id=product_id)
+            _METADATA_CACHE[product_id] = metadata
+    return metadata
@@ -13,72 +13,127 @@ Advanced Features:
 """
 
 import asyncio
-from typing import Any
-from dataclasses import dataclass
+from typing import Any, ClassVar
+from dataclasses import dataclass, replace
+import numpy as np
+import pandas as pd
 from statscan.wds.client import Client
+from statscan.wds.models.datapoint import DataPoint
+from statscan.wds.models.series import ChangedSeriesData
+
+from _metadata_cache import cached_get_cube_metadata
+
+# Maximum number of WDS requests in flight at once; keeps sweeps overlapped
+# without flooding the server with simultaneous requests
+DEFAULT_MAX_CONCURRENCY = 8
+
+# Remaining seven dimensions of a parameter-based query coordinate
+_COORD_TAIL = ".1" * 7
+
+# Parameter-based query scenarios demonstrated by parameter_based_queries
+_QUERY_SCENARIOS: tuple[dict[str, Any], ...] = (
+    {
+        "name": "National Overview",
+        "params": {"geography": "1", "gender": "1", "age": "1"},
+        "description": "Canada total population, all demographics",
+    },
+    {
+        "name": "Youth Demographics (Male)",
+        "params": {
+            "geography": "1",
+            "gender": "2",
+            "age": "2",
+        },  # Assuming age group 2 = youth
+        "description": "Canada male youth population",
+    },
+    {
+        "name": "Working Age (Female)",
+        "params": {
+            "geography": "1",
+            "gender": "3",
+            "age": "3",
+        },  # Assuming age group 3 = working age
+        "description": "Canada female working age population",
+    },
+)
+
+def _growth_rates(values: np.ndarray) -> np.ndarray:
+    """
+    Period-over-period growth (%) for a newest-first series.
+
+    Each value is compared with the next (older) one; the oldest period, or one
+    whose predecessor is non-positive, has no growth rate (NaN).
+    """
+    growth = np.full_like(values, np.nan)
+    previous = values[1:]
+    np.divide(
+        (values[:-1] - previous) * 100.0,
+        previous,
+        out=growth[:-1],
+        where=previous > 0,
+    )
+    return growth
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CoordinateBuilder:
-    """Advanced coordinate construction utility."""
+    """
+    Advanced coordinate construction utility.
+
+    Builders are immutable, so the `with_*` methods return new builders that
+    share the same `additional_dims` tuple instead of copying it.
+    """
 
     geography: str = "1"  # 1=Canada, 35=Ontario, etc.
     gender: str = "1"  # 1=Both, 2=Male, 3=Female
     age_group: str = "1"  # 1=All ages, 2=0-14, 3=15-64, etc.
-    additional_dims: list[str] | None = None
+    additional_dims: tuple[str, ...] = ("1",) * 7  # Default remaining dimensions to "1"
 
-    def __post_init__(self):
-        if self.additional_dims is None:
-            self.additional_dims = ["1"] * 7  # Default remaining dimensions to "1"
+    # WDS coordinates are typically 10 dimensions: geography, gender, age + 7 more
+    _TEMPLATE: ClassVar[str] = ".".join(["{}"] * 10)
 
     def build(self) -> str:
         """Build complete coordinate string."""
-        dims = self.additional_dims if self.additional_dims is not None else ["1"] * 7
-        coords = [self.geography, self.gender, self.age_group] + dims
-        return ".".join(coords[:10])  # WDS coordinates are typically 10 dimensions
+        # str.format ignores surplus positional arguments, capping the result at 10 dimensions
+        return self._TEMPLATE.format(
+            self.geography, self.gender, self.age_group, *self.additional_dims
+        )
 
     def with_geography(self, geo_code: str | int) -> "CoordinateBuilder":
         """Create new builder with different geography."""
-        new_builder = CoordinateBuilder(
-            geography=str(geo_code),
-            gender=self.gender,
-            age_group=self.age_group,
-            additional_dims=self.additional_dims.copy()
-            if self.additional_dims
-            else None,
-        )
-        return new_builder
+        return replace(self, geography=str(geo_code))
 
     def with_gender(self, gender_code: str | int) -> "CoordinateBuilder":
         """Create new builder with different gender filter."""
-        new_builder = CoordinateBuilder(
-            geography=self.geography,
-            gender=str(gender_code),
-            age_group=self.age_group,
-            additional_dims=self.additional_dims.copy()
-            if self.additional_dims
-            else None,
-        )
-        return new_builder
+        return replace(self, gender=str(gender_code))
 
     def with_age_group(self, age_code: str | int) -> "CoordinateBuilder":
         """Create new builder with different age group."""
-        new_builder = CoordinateBuilder(
-            geography=self.geography,
-            gender=self.gender,
-            age_group=str(age_code),
-            additional_dims=self.additional_dims.copy()
-            if self.additional_dims
-            else None,
-        )
-        return new_builder
+        return replace(self, age_group=str(age_code))
 
 
 class AdvancedCoordinateSystem:
     """Advanced coordinate manipulation and data analysis."""
 
-    def __init__(self):
-        self.client = Client()
+    def __init__(
+        self,
+        client: Client | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ):
+        self.client = client or Client()
+        self.max_concurrency = max_concurrency
+        self._sem = asyncio.Semaphore(max_concurrency)
+        # Longest time series fetched so far per (product_id, coordinate)
+        self._ts_cache: dict[tuple[int, str], list[DataPoint]] = {}
+
+    async def _fetch_latest(
+        self, product_id: int, coordinate: str, periods: int = 1
+    ) -> ChangedSeriesData:
+        """Fetch the latest periods for a coordinate, bounded by the concurrency limit."""
+        async with self._sem:
+            return await self.client.get_data_from_cube_pid_coord_and_latest_n_periods(
+                product_id=product_id, coordinate=coordinate, n=periods
+            )
 
     async def multi_dimensional_analysis(
         self, product_id: int, base_coordinate: str
@@ -98,40 +153,56 @@ class AdvancedCoordinateSystem:
         }
 
         # Gender variations for each geography
+        gender_codes = {"Total": "1", "Male": "2", "Female": "3"}
+
+        # Build every (geography, gender) coordinate up front so the independent
+        # requests can be issued concurrently rather than one round trip at a time
+        keys = [
+            (geo_name, gender_name)
+            for geo_name in geographic_variants
+            for gender_name in gender_codes
+        ]
+        coordinates = [
+            geographic_variants[geo_name].with_gender(gender_codes[gender_name]).build()
+            for geo_name, gender_name in keys
+        ]
+        responses = await asyncio.gather(
+            *(
+                self._fetch_latest(product_id=product_id, coordinate=coordinate)
+                for coordinate in coordinates
+            ),
+            return_exceptions=True,
+        )
+        responses_by_key = dict(zip(keys, zip(coordinates, responses)))
+
         results = {}
 
-        for geo_name, geo_builder in geographic_variants.items():
+        for geo_name in geographic_variants:
             geo_results = {}
+            lines: list[str] = []
 
-            gender_variants = {
-                "Total": geo_builder.with_gender("1"),
-                "Male": geo_builder.with_gender("2"),
-                "Female": geo_builder.with_gender("3"),
-            }
-
-            for gender_name, gender_builder in gender_variants.items():
-                coordinate = gender_builder.build()
+            for gender_name in gender_codes:
+                coordinate, response = responses_by_key[(geo_name, gender_name)]
 
                 try:
-                    response = await self.client.get_data_from_cube_pid_coord_and_latest_n_periods(
-                        product_id=product_id, coordinate=coordinate, periods=1
-                    )
+                    if isinstance(response, BaseException):
+                        raise response
 
-                    if response["status"] == "SUCCESS" and response["object"]:
-                        data = response["object"][0]
+                    if response.vectorDataPoint:
+                        data = response.vectorDataPoint[0]
                         geo_results[gender_name] = {
-                            "population": data["vectorDataPoint"],
+                            "population": data.value,
                             "coordinate": coordinate,
                         }
-                        print(
-                            f"  {geo_name} - {gender_name}: {data['vectorDataPoint']:,}"
-                        )
+                        lines.append(f"  {geo_name} - {gender_name}: {data.value:,}")
 
                 except Exception as e:
-                    print(f"  ⚠️  {geo_name} - {gender_name}: Error - {e}")
+                    lines.append(f"  ⚠️  {geo_name} - {gender_name}: Error - {e}")
 
             results[geo_name] = geo_results
-            print()
+            # One write per geography; the trailing "" keeps the blank separator line
+            lines.append("")
+            print("\n".join(lines))
 
         return results
 
@@ -143,41 +214,54 @@ class AdvancedCoordinateSystem:
         print("-" * 40)
 
         try:
-            # Get multiple periods of data
-            response = (
-                await self.client.get_data_from_cube_pid_coord_and_latest_n_periods(
-                    product_id=product_id, coordinate=base_coordinate, periods=periods
+            # Get multiple periods of data, serving smaller requests from the
+            # longest series already fetched for this coordinate
+            key = (product_id, base_coordinate)
+            cached = self._ts_cache.get(key, [])
+            if len(cached) >= periods:
+                time_series = cached[:periods]
+            else:
+                response = await self._fetch_latest(
+                    product_id=product_id,
+                    coordinate=base_coordinate,
+                    periods=max(periods, len(cached)),
                 )
-            )
-
-            if response["status"] == "SUCCESS" and response["object"]:
-                time_series = response["object"]
+                time_series = response.vectorDataPoint
+                if time_series:
+                    self._ts_cache[key] = time_series
 
+            if time_series:
                 print(f"Retrieved {len(time_series)} time periods:")
 
+                # Period-over-period growth for the whole (newest first) series at once
+                values = np.fromiter(
+                    (dp.value for dp in time_series),
+                    dtype=np.float64,
+                    count=len(time_series),
+                )
+                growth = _growth_rates(values)
+
                 results = []
                 for i, data_point in enumerate(time_series):
                     result = {
-                        "period": data_point["refPer"],
-                        "value": data_point["vectorDataPoint"],
+                        "period": data_point.refPer,
+                        "value": data_point.value,
                         "coordinate": base_coordinate,
                         "sequence": i + 1,
+                        "growth_rate": float(growth[i]),
                     }
                     results.append(result)
 
                     print(
-                        f"  Period {i + 1}: {data_point['refPer']} → {data_point['vectorDataPoint']:,}"
+                        f"  Period {i + 1}: {data_point.refPer} → {data_point.value:,}"
                     )
 
-                # Calculate growth rates
+                # Report growth rates
                 if len(results) > 1:
                     print("\n📊 Growth Analysis:")
-                    latest = results[0]["value"]
-                    previous = results[1]["value"]
 
-                    if previous > 0:
-                        growth_rate = ((latest - previous) / previous) * 100
-                        print(f"  Latest Period Growth: {growth_rate:+.2f}%")
+                    if not np.isnan(growth[0]):
+                        print(f"  Latest Period Growth: {growth[0]:+.2f}%")
 
                 return results
 
@@ -191,69 +275,55 @@ class AdvancedCoordinateSystem:
         print("⚙️  Parameter-Based Query Construction")
         print("-" * 40)
 
-        # Define query parameters
-        query_scenarios: list[dict[str, Any]] = [
-            {
-                "name": "National Overview",
-                "params": {"geography": "1", "gender": "1", "age": "1"},
-                "description": "Canada total population, all demographics",
-            },
-            {
-                "name": "Youth Demographics (Male)",
-                "params": {
-                    "geography": "1",
-                    "gender": "2",
-                    "age": "2",
-                },  # Assuming age group 2 = youth
-                "description": "Canada male youth population",
-            },
-            {
-                "name": "Working Age (Female)",
-                "params": {
-                    "geography": "1",
-                    "gender": "3",
-                    "age": "3",
-                },  # Assuming age group 3 = working age
-                "description": "Canada female working age population",
-            },
+        # Build coordinates from parameters and fetch all scenarios concurrently
+        scenario_params: list[dict[str, str]] = [
+            scenario["params"] for scenario in _QUERY_SCENARIOS  # type: ignore
+        ]
+        coordinates = [
+            f"{params['geography']}.{params['gender']}.{params['age']}" + _COORD_TAIL
+            for params in scenario_params
         ]
+        responses = await asyncio.gather(
+            *(
+                self._fetch_latest(product_id=product_id, coordinate=coordinate)
+                for coordinate in coordinates
+            ),
+            return_exceptions=True,
+        )
 
         results = {}
+        lines: list[str] = []
 
-        for scenario in query_scenarios:
-            print(f"\n🔍 {scenario['name']}")
-            print(f"   {scenario['description']}")
-
-            # Build coordinate from parameters
-            params: dict[str, str] = scenario["params"]  # type: ignore
-            coordinate = f"{params['geography']}.{params['gender']}.{params['age']}.1.1.1.1.1.1.1"
+        for scenario, params, coordinate, response in zip(
+            _QUERY_SCENARIOS, scenario_params, coordinates, responses
+        ):
+            lines.append(f"\n🔍 {scenario['name']}")
+            lines.append(f"   {scenario['description']}")
 
             try:
-                response = (
-                    await self.client.get_data_from_cube_pid_coord_and_latest_n_periods(
-                        product_id=product_id, coordinate=coordinate, periods=1
-                    )
-                )
+                if isinstance(response, BaseException):
+                    raise response
 
-                if response["status"] == "SUCCESS" and response["object"]:
-                    data = response["object"][0]
+                if response.vectorDataPoint:
+                    data = response.vectorDataPoint[0]
                     result = {
                         "coordinate": coordinate,
-                        "population": data["vectorDataPoint"],
-                        "period": data["refPer"],
-                        "parameters": params,
+                        "population": data.value,
+                        "period": data.refPer,
+                        "parameters": dict(params),
                     }
                     name: str = scenario["name"]  # type: ignore
                     results[name] = result
 
-                    print(f"   Population: {data['vectorDataPoint']:,}")
-                    print(f"   Coordinate: {coordinate}")
+                    lines.append(f"   Population: {data.value:,}")
+                    lines.append(f"   Coordinate: {coordinate}")
                 else:
-                    print("   ❌ No data returned")
+                    lines.append("   ❌ No data returned")
 
             except Exception as e:
-                print(f"   ⚠️  Query error: {e}")
+                lines.append(f"   ⚠️  Query error: {e}")
 
+        print("\n".join(lines))
         return results
 
     async def coordinate_validation_and_debugging(self, product_id: int) -> None:
@@ -262,16 +332,15 @@ class AdvancedCoordinateSystem:
         print("-" * 40)
 
         # Get cube metadata for validation
-        metadata = await self.client.get_cube_metadata(product_id=product_id)
-
-        if metadata["status"] != "SUCCESS":
-            print("❌ Cannot validate - metadata unavailable")
+        try:
+            cube = await cached_get_cube_metadata(self.client, product_id)
+        except Exception as e:
+            print(f"❌ Cannot validate - metadata unavailable ({e})")
             return
 
-        cube = metadata["object"]
-        dimensions = cube["dimension"]
+        dimensions = cube.dimensions or []
 
-        print(f"Cube: {cube['cubeTitleEn']}")
+        print(f"Cube: {cube.cubeTitleEn}")
         print(f"Expected coordinate length: {len(dimensions)} dimensions")
 
         # Test various coordinate formats
@@ -284,37 +353,64 @@ class AdvancedCoordinateSystem:
 
         print("\n🧪 Testing Coordinate Formats:")
 
+        # Reject provably-invalid coordinates locally (wrong length or unknown
+        # member IDs) so only plausible candidates cost a network round trip
+        valid_ids = [
+            frozenset(str(member.memberId) for member in dim.member)
+            for dim in dimensions
+        ]
+
+        def _valid(coord: str) -> bool:
+            parts = coord.split(".")
+            return len(parts) == len(valid_ids) and all(
+                part in ids for part, ids in zip(parts, valid_ids)
+            )
+
+        candidates = []
+        lines: list[str] = []
         for coord in test_coordinates:
+            if _valid(coord):
+                candidates.append(coord)
+            else:
+                lines.append(f"  ❌ {coord} → Invalid (pre-check)")
+
+        responses = await asyncio.gather(
+            *(
+                self._fetch_latest(product_id=product_id, coordinate=coord)
+                for coord in candidates
+            ),
+            return_exceptions=True,
+        )
+
+        for coord, response in zip(candidates, responses):
             try:
-                response = (
-                    await self.client.get_data_from_cube_pid_coord_and_latest_n_periods(
-                        product_id=product_id, coordinate=coord, periods=1
-                    )
-                )
+                if isinstance(response, BaseException):
+                    raise response
 
-                if response["status"] == "SUCCESS" and response["object"]:
-                    print(f"  ✅ {coord} → Valid (returned data)")
+                if response.vectorDataPoint:
+                    lines.append(f"  ✅ {coord} → Valid (returned data)")
                 else:
-                    print(f"  ❌ {coord} → Invalid ({response['status']})")
+                    lines.append(f"  ❌ {coord} → Invalid (no data returned)")
 
             except Exception as e:
-                print(f"  ⚠️  {coord} → Exception: {type(e).__name__}")
+                lines.append(f"  ⚠️  {coord} → Exception: {type(e).__name__}")
+
+        if lines:
+            print("\n".join(lines))
 
         # Show dimension structure for reference
         print("\n📋 Dimension Reference:")
         for i, dim in enumerate(dimensions[:5]):  # Show first 5
             print(
-                f"  Position {i + 1}: {dim['dimensionNameEn']} ({len(dim['member'])} options)"
+                f"  Position {i + 1}: {dim.dimensionNameEn} ({len(dim.member)} options)"
             )
 
 
-async def advanced_aggregation_example():
+async def advanced_aggregation_example(coordinator: AdvancedCoordinateSystem):
     """Show complex data aggregation using coordinate manipulation."""
     print("\n📊 Advanced Data Aggregation Example")
     print("=" * 60)
 
-    coordinator = AdvancedCoordinateSystem()
-
     # Use population cube for demonstration
     product_id = 98100002  # Census population data
 
@@ -329,45 +425,59 @@ async def advanced_aggregation_example():
     if analysis_results:
         print("\n📈 Aggregated Insights:")
 
-        for geography, data in analysis_results.items():
-            if "Total" in data and "Male" in data and "Female" in data:
-                total = data["Total"]["population"]
-                male = data["Male"]["population"]
-                female = data["Female"]["population"]
-
-                if total > 0:
-                    male_pct = (male / total) * 100
-                    female_pct = (female / total) * 100
+        # One row per geography, one column per gender; percentages are computed
+        # column-wise for every geography at once
+        df = pd.DataFrame.from_dict(
+            {
+                geography: {gender: d["population"] for gender, d in data.items()}
+                for geography, data in analysis_results.items()
+            },
+            orient="index",
+        ).reindex(columns=["Total", "Male", "Female"])
+        df = df[df.notna().all(axis=1) & (df["Total"] > 0)]
+        df[["male_pct", "female_pct"]] = (
+            df[["Male", "Female"]].div(df["Total"], axis=0) * 100
+        )
 
-                    print(f"  {geography}:")
-                    print(f"    Total Population: {total:,}")
-                    print(
-                        f"    Gender Split: {male_pct:.1f}% Male, {female_pct:.1f}% Female"
-                    )
+        print(
+            df.to_string(
+                formatters={
+                    "Total": "{:,.0f}".format,
+                    "Male": "{:,.0f}".format,
+                    "Female": "{:,.0f}".format,
+                    "male_pct": "{:.1f}%".format,
+                    "female_pct": "{:.1f}%".format,
+                }
+            )
+        )
 
 
 async def main():
     """Run advanced coordinate system examples."""
-    coordinator = AdvancedCoordinateSystem()
+    # One client (and connection pool) shared by every example
+    async with Client() as client:
+        coordinator = AdvancedCoordinateSystem(client=client)
 
-    # Product for demonstrations
-    product_id = 98100002  # Census population data
-    base_coordinate = "1.1.1.1.1.1.1.1.1.1"  # Canada, total
+        # Product for demonstrations
+        product_id = 98100002  # Census population data
+        base_coordinate = "1.1.1.1.1.1.1.1.1.1"  # Canada, total
 
-    print("🚀 Advanced Coordinate System Examples")
-    print("=" * 60)
+        print("🚀 Advanced Coordinate System Examples")
+        print("=" * 60)
 
-    # Parameter-based queries
-    await coordinator.parameter_based_queries(product_id)
+        # Parameter-based queries
+        await coordinator.parameter_based_queries(product_id)
 
-    # Time series analysis
-    await coordinator.time_series_coordinates(product_id, base_coordinate, periods=3)
+        # Time series analysis
+        await coordinator.time_series_coordinates(
+            product_id, base_coordinate, periods=3
+        )
 
-    # Coordinate validation
-    await coordinator.coordinate_validation_and_debugging(product_id)
+        # Coordinate validation
+        await coordinator.coordinate_validation_and_debugging(product_id)
 
-    # Advanced aggregation
-    await advanced_aggregation_example()
+        # Advanced aggregation
+        await advanced_aggregation_example(coordinator)
 
     print("\n🎉 Advanced Coordinate Examples Complete!")
     print("💡 These patterns enable sophisticated statistical analysis")
@@ -375,6 +485,5 @@ async def main():
         "   Combine with demographic_analysis.py for comprehensive research workflows"
     )
 
-
 if __name__ == "__main__":
     asyncio.run(main())
@@ -16,26 +16,25 @@ import asyncio
 from statscan.wds.client import Client
 from statscan.enums.auto.wds.product_id import ProductID
 
+from _metadata_cache import cached_get_cube_metadata
 
-async def basic_api_usage():
+
+async def basic_api_usage(client: Client):
     """Demonstrate basic WDS API patterns."""
     print("🚀 Statistics Canada WDS API - Basic Usage")
     print("=" * 50)
 
-    # Initialize client
-    client = Client()
-
     # 1. Discover available products
     print("\n📊 1. Product Discovery")
     print("-" * 30)
 
     # Get basic population cube metadata
     population_product = ProductID.POP_AND_DWEL_COUNTS_CAN_PROV_AND_TERR_CEN_METRO_AREAS_AND_CEN_AGGLOMERATIONS
-    metadata = await client.get_cube_metadata(product_id=population_product.value)
+    metadata = await cached_get_cube_metadata(client, population_product.value)
 
     print(f"Product ID: {population_product.value}")
-    print(f"Title: {metadata['object']['cubeTitleEn']}")
-    print(f"Dimensions: {len(metadata['object']['dimension'])} dimensions")
+    print(f"Title: {metadata.cubeTitleEn}")
+    print(f"Dimensions: {len(metadata.dimensions or [])} dimensions")
 
     # 2. Simple coordinate-based data request
     print("\n📈 2. Basic Data Request")
@@ -45,32 +44,31 @@ async def basic_api_usage():
     coordinates = "1.1.1.1.1.1.1.1.1.1"  # Canada, both sexes, total age, 2021
     periods = 1  # Latest period only
 
-    data_response = await client.get_data_from_cube_pid_coord_and_latest_n_periods(
-        product_id=population_product.value, coordinate=coordinates, periods=periods
-    )
-
-    if data_response["status"] == "SUCCESS":
-        observations = data_response["object"]
-        if observations:
-            latest_data = observations[0]
-            print(f"Canada Population (2021): {latest_data['vectorDataPoint']:,}")
-            print(f"Reference Date: {latest_data['refPer']}")
+    try:
+        series_data = await client.get_data_from_cube_pid_coord_and_latest_n_periods(
+            product_id=population_product.value, coordinate=coordinates, n=periods
+        )
+    except Exception as e:
+        print(f"API Error: {type(e).__name__}: {e}")
+    else:
+        if series_data.vectorDataPoint:
+            latest_data = series_data.vectorDataPoint[0]
+            print(f"Canada Population (2021): {latest_data.value:,}")
+            print(f"Reference Date: {latest_data.refPer}")
         else:
             print("No data returned for specified coordinates")
-    else:
-        print(f"API Error: {data_response.get('status', 'Unknown error')}")
 
     # 3. Explore cube structure
     print("\n🔍 3. Cube Structure Exploration")
     print("-" * 30)
 
     # Show dimension information
-    dimensions = metadata["object"]["dimension"]
+    dimensions = metadata.dimensions or []
     for i, dim in enumerate(dimensions[:3]):  # Show first 3 dimensions
-        print(f"Dimension {i + 1}: {dim['dimensionNameEn']}")
-        print(f"  Members: {len(dim['member'])} options")
-        if dim["member"]:
-            print(f"  Example: {dim['member'][0]['memberNameEn']}")
+        print(f"Dimension {i + 1}: {dim.dimensionNameEn}")
+        print(f"  Members: {len(dim.member)} options")
+        if dim.member:
+            print(f"  Example: {dim.member[0].memberNameEn}")
         print()
 
     print(f"💡 This cube has {len(dimensions)} total dimensions")
@@ -109,22 +107,16 @@ async def working_with_enums():
         print(f"  • {freq.name}: {freq.value}")
 
 
-async def error_handling_patterns():
+async def error_handling_patterns(client: Client):
     """Show proper error handling for WDS API calls."""
     print("\n⚠️  Error Handling Best Practices")
     print("=" * 50)
 
-    client = Client()
-
     try:
         # Example of handling invalid product ID
         print("Testing invalid product ID handling...")
-        response = await client.get_cube_metadata(product_id=99999999)
-
-        if response["status"] != "SUCCESS":
-            print(f"✅ Properly handled API error: {response['status']}")
-        else:
-            print("⚠️  Unexpected success with invalid product ID")
+        await client.get_cube_metadata(product_id=99999999)
+        print("⚠️  Unexpected success with invalid product ID")
 
     except Exception as e:
         print(f"✅ Caught exception: {type(e).__name__}: {e}")
@@ -132,20 +124,18 @@ async def error_handling_patterns():
     try:
         # Example of handling invalid coordinates
         print("\nTesting invalid coordinate handling...")
-        response = await client.get_data_from_cube_pid_coord_and_latest_n_periods(
-            product_id=ProductID.POPULATION_AND_DWELLINGS_COUNTS_CANADA_PROVINCES_TERRITORIES_CENSUS_METROPOLITAN_AREAS_AND_CENSUS_AGGLOMERATIONS_INCLUDING_PARTS.value,
+        await client.get_data_from_cube_pid_coord_and_latest_n_periods(
+            product_id=ProductID.POP_AND_DWEL_COUNTS_CAN_PROV_AND_TERR_CEN_METRO_AREAS_AND_CEN_AGGLOMERATIONS.value,
             coordinate="999.999.999",  # Invalid coordinate format
-            periods=1,
+            n=1,
         )
-
-        if response["status"] != "SUCCESS":
-            print(f"✅ Properly handled coordinate error: {response['status']}")
+        print("⚠️  Unexpected success with invalid coordinate")
 
     except Exception as e:
         print(f"✅ Caught coordinate exception: {type(e).__name__}: {e}")
 
     print("\n💡 Key Error Handling Tips:")
-    print("  • Always check response['status'] for 'SUCCESS'")
+    print("  • Failed requests raise; catch errors around each API call")
     print("  • Use try/catch for network and parsing errors")
     print("  • Validate coordinates before API calls")
     print("  • Handle empty result sets gracefully")
@@ -153,9 +143,11 @@ async def error_handling_patterns():
 
 async def main():
     """Run all basic usage examples."""
-    await basic_api_usage()
-    await working_with_enums()
-    await error_handling_patterns()
+    # Initialize a single client and share its connection pool across examples
+    async with Client() as client:
+        await basic_api_usage(client)
+        await working_with_enums()
+        await error_handling_patterns(client)
 
     print("\n🎉 Basic Usage Examples Complete!")
     print("Next steps: Try demographic_analysis.py for real-world use cases")
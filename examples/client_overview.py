@@ -9,7 +9,7 @@ import asyncio
 from statscan.wds.client import Client
 
 
-async def demonstrate_client_capabilities():
+async def demonstrate_client_capabilities(client: Client):
     """Demonstrate the complete Client functionality."""
 
     print("🏆 WDS CLIENT OVERVIEW")
@@ -23,9 +23,6 @@ async def demonstrate_client_capabilities():
     print("• Data retrieval in multiple formats")
     print()
 
-    # Initialize single client for everything
-    client = Client()
-
     # 1. Basic population lookup
     print("1️⃣ SIMPLE POPULATION LOOKUP")
     print("-" * 30)
@@ -102,5 +99,12 @@ async def demonstrate_client_capabilities():
     print("✅ Simpler testing and debugging")
 
 
+async def main():
+    """Run the client overview with a single shared client."""
+    # Initialize single client for everything
+    async with Client() as client:
+        await demonstrate_client_capabilities(client)
+
+
 if __name__ == "__main__":
-    asyncio.run(demonstrate_client_capabilities())
+    asyncio.run(main())
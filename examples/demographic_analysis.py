@@ -15,15 +15,33 @@ Real-world Use Case: Analyzing population demographics for Saugeen Shores, Ontar
 import asyncio
 from typing import Any
 
+import numpy as np
+
 from statscan.wds.client import Client
+from statscan.wds.models.cube import Cube
 from statscan.enums.auto.wds.product_id import ProductID
 
+from _http import create_client
+from _metadata_cache import cached_get_cube_metadata
+
+# Coordinate tails for the Total / Male / Female breakdowns of a location
+_AGE_GENDER_LABELS = ("Total", "Male", "Female")
+_AGE_GENDER_SUFFIXES = (
+    ".1.1.1.1.1.1.1.1.1",  # Total population
+    ".2.1.1.1.1.1.1.1.1",  # Male population
+    ".3.1.1.1.1.1.1.1.1",  # Female population
+)
+
 
 class DemographicAnalyzer:
     """Utility class for comprehensive demographic analysis."""
 
-    def __init__(self):
-        self.client = Client()
+    def __init__(self, client: Client | None = None):
+        self.client = client or create_client()
+
+    async def _get_metadata(self, product_id: int) -> Cube:
+        """Fetch cube metadata, memoized per product ID."""
+        return await cached_get_cube_metadata(self.client, product_id)
 
     async def get_population_summary(
         self, product_id: int, coordinates: list[str], location_name: str
@@ -32,28 +50,39 @@ class DemographicAnalyzer:
         print(f"\n📊 Population Summary: {location_name}")
         print("-" * 40)
 
+        # Coordinates are independent, so fetch them all concurrently
+        responses = await asyncio.gather(
+            *(
+                self.client.get_data_from_cube_pid_coord_and_latest_n_periods(
+                    product_id=product_id, coordinate=coord, n=1
+                )
+                for coord in coordinates
+            ),
+            return_exceptions=True,
+        )
+
         results = {}
-        for coord in coordinates:
+        lines: list[str] = []
+        for coord, response in zip(coordinates, responses):
             try:
-                response = (
-                    await self.client.get_data_from_cube_pid_coord_and_latest_n_periods(
-                        product_id=product_id, coordinate=coord, periods=1
-                    )
-                )
+                if isinstance(response, BaseException):
+                    raise response
 
-                if response["status"] == "SUCCESS" and response["object"]:
-                    data = response["object"][0]
+                if response.vectorDataPoint:
+                    data = response.vectorDataPoint[0]
                     results[coord] = {
-                        "population": data["vectorDataPoint"],
-                        "reference_date": data["refPer"],
+                        "population": data.value,
+                        "reference_date": data.refPer,
                     }
-                    print(f"  Coordinate {coord}: {data['vectorDataPoint']:,} people")
+                    lines.append(f"  Coordinate {coord}: {data.value:,} people")
                 else:
-                    print(f"  ⚠️  No data for coordinate {coord}")
+                    lines.append(f"  ⚠️  No data for coordinate {coord}")
 
             except Exception as e:
-                print(f"  ❌ Error with coordinate {coord}: {e}")
+                lines.append(f"  ❌ Error with coordinate {coord}: {e}")
 
+        if lines:
+            print("\n".join(lines))
         return results
 
     async def analyze_age_gender_demographics(
@@ -67,38 +96,45 @@ class DemographicAnalyzer:
         product_id = 98100002  # Census population data
 
         # Get cube metadata to understand dimensions
-        metadata = await self.client.get_cube_metadata(product_id=product_id)
+        metadata = await self._get_metadata(product_id)
 
         print(f"Analyzing demographics using Product ID: {product_id}")
-        print(f"Cube: {metadata['object']['cubeTitleEn']}")
+        print(f"Cube: {metadata.cubeTitleEn}")
 
         # Example coordinates for different age/gender breakdowns
         # Note: Actual coordinates depend on cube structure
         demo_coordinates = [
-            f"{location_coordinates}.1.1.1.1.1.1.1.1.1",  # Total population
-            f"{location_coordinates}.2.1.1.1.1.1.1.1.1",  # Male population
-            f"{location_coordinates}.3.1.1.1.1.1.1.1.1",  # Female population
+            location_coordinates + suffix for suffix in _AGE_GENDER_SUFFIXES
         ]
 
         results = {}
-        labels = ["Total", "Male", "Female"]
 
-        for coord, label in zip(demo_coordinates, labels):
-            try:
-                response = (
-                    await self.client.get_data_from_cube_pid_coord_and_latest_n_periods(
-                        product_id=product_id, coordinate=coord, periods=1
-                    )
+        responses = await asyncio.gather(
+            *(
+                self.client.get_data_from_cube_pid_coord_and_latest_n_periods(
+                    product_id=product_id, coordinate=coord, n=1
                 )
+                for coord in demo_coordinates
+            ),
+            return_exceptions=True,
+        )
+
+        lines: list[str] = []
+        for label, response in zip(_AGE_GENDER_LABELS, responses):
+            try:
+                if isinstance(response, BaseException):
+                    raise response
 
-                if response["status"] == "SUCCESS" and response["object"]:
-                    data = response["object"][0]
-                    results[label] = data["vectorDataPoint"]
-                    print(f"  {label}: {data['vectorDataPoint']:,}")
+                if response.vectorDataPoint:
+                    data = response.vectorDataPoint[0]
+                    results[label] = data.value
+                    lines.append(f"  {label}: {data.value:,}")
 
             except Exception as e:
-                print(f"  ⚠️  Could not get {label} data: {e}")
+                lines.append(f"  ⚠️  Could not get {label} data: {e}")
 
+        if lines:
+            print("\n".join(lines))
         return results
 
     async def household_analysis(self, location_coordinates: str) -> dict[str, Any]:
@@ -109,8 +145,8 @@ class DemographicAnalyzer:
         product_id = 98100003  # Census household data
 
         # Get metadata
-        metadata = await self.client.get_cube_metadata(product_id=product_id)
-        print(f"Using: {metadata['object']['cubeTitleEn']}")
+        metadata = await self._get_metadata(product_id)
+        print(f"Using: {metadata.cubeTitleEn}")
 
         # Try to get household data
         try:
@@ -118,14 +154,14 @@ class DemographicAnalyzer:
                 await self.client.get_data_from_cube_pid_coord_and_latest_n_periods(
                     product_id=product_id,
                     coordinate=f"{location_coordinates}.1.1.1.1.1.1.1.1.1",
-                    periods=1,
+                    n=1,
                 )
             )
 
-            if response["status"] == "SUCCESS" and response["object"]:
-                data = response["object"][0]
-                print(f"  Total Households: {data['vectorDataPoint']:,}")
-                return {"total_households": data["vectorDataPoint"]}
+            if response.vectorDataPoint:
+                data = response.vectorDataPoint[0]
+                print(f"  Total Households: {data.value:,}")
+                return {"total_households": data.value}
             else:
                 print("  ⚠️  No household data available")
 
@@ -151,6 +187,14 @@ class DemographicAnalyzer:
 
         # Population overview
         pop_product = 98100002  # Census population data
+        household_product = 98100003  # Census household data
+
+        # Warm the metadata cache for both sections in one concurrent round trip;
+        # the sections themselves run in order so their output stays readable
+        await asyncio.gather(
+            self._get_metadata(pop_product),
+            self._get_metadata(household_product),
+        )
 
         population_data = await self.get_population_summary(
             pop_product, [coordinates], location_name
@@ -172,30 +216,33 @@ class DemographicAnalyzer:
             female_pop = demographics.get("Female", 0)
 
             if total_pop > 0:
-                print("\n📈 Summary Statistics:")
-                print(f"  • Total Population: {total_pop:,}")
+                lines = [
+                    "\n📈 Summary Statistics:",
+                    f"  • Total Population: {total_pop:,}",
+                ]
                 if male_pop and female_pop:
-                    print(
+                    lines.append(
                         f"  • Gender Distribution: {male_pop / total_pop * 100:.1f}% Male, {female_pop / total_pop * 100:.1f}% Female"
                     )
 
                 if households and households.get("total_households"):
                     avg_household_size = total_pop / households["total_households"]
-                    print(
+                    lines.append(
                         f"  • Average Household Size: {avg_household_size:.1f} people"
                     )
+                print("\n".join(lines))
 
         return report
 
 
-async def saugeen_shores_case_study():
+async def saugeen_shores_case_study(client: Client | None = None):
     """Real-world example: Analyzing Saugeen Shores, Ontario demographics."""
     print("🏘️  Case Study: Saugeen Shores, Ontario")
     print("=" * 60)
     print("Saugeen Shores is a town in Bruce County, Ontario")
     print("This example shows municipal-level demographic analysis\n")
 
-    analyzer = DemographicAnalyzer()
+    analyzer = DemographicAnalyzer(client)
 
     # Saugeen Shores coordinates (example - actual coordinates need verification)
     # This represents: Ontario > Bruce County > Saugeen Shores
@@ -227,12 +274,12 @@ async def saugeen_shores_case_study():
     return report
 
 
-async def comparative_analysis_example():
+async def comparative_analysis_example(client: Client | None = None):
     """Example of comparing multiple geographic areas."""
     print("\n🔄 Comparative Analysis Example")
     print("=" * 60)
 
-    analyzer = DemographicAnalyzer()
+    analyzer = DemographicAnalyzer(client)
 
     # Compare different geographic levels
     locations = [
@@ -241,7 +288,7 @@ async def comparative_analysis_example():
         ("Bruce County", "1.35.3539.1.1.1.1.1.1.1"),  # Example
     ]
 
-    product_id = ProductID.POPULATION_AND_DWELLINGS_COUNTS_CANADA_PROVINCES_AND_TERRITORIES_CENSUS_METROPOLITAN_AREAS_AND_CENSUS_AGGLOMERATIONS_INCLUDING_PARTS.value
+    product_id = ProductID.POP_AND_DWEL_COUNTS_CAN_PROV_AND_TERR_CEN_METRO_AREAS_AND_CEN_AGGLOMERATIONS.value
 
     print("Comparing population across geographic levels:")
 
@@ -256,20 +303,39 @@ async def comparative_analysis_example():
         print("\n📊 Comparative Statistics:")
         canada_pop = comparative_data.get("Canada", {}).get("population", 1)
 
-        for location, data in comparative_data.items():
-            if location != "Canada":
-                population = data.get("population", 0)
-                percentage = (population / canada_pop) * 100 if canada_pop > 0 else 0
-                print(f"  • {location}: {percentage:.2f}% of Canada's population")
+        # Compute every share of the national population in one vectorized pass
+        others = [name for name in comparative_data if name != "Canada"]
+        populations = np.fromiter(
+            (comparative_data[name].get("population", 0) for name in others),
+            dtype=np.float64,
+            count=len(others),
+        )
+        percentages = (
+            populations * (100.0 / canada_pop)
+            if canada_pop > 0
+            else np.zeros_like(populations)
+        )
+
+        for location, percentage in zip(others, percentages):
+            print(f"  • {location}: {percentage:.2f}% of Canada's population")
 
 
 async def main():
     """Run demographic analysis examples."""
-    # Real-world case study
-    await saugeen_shores_case_study()
-
-    # Comparative analysis
-    await comparative_analysis_example()
+    # Share one pooled client across both examples; each example already issues
+    # its independent requests concurrently, so the examples themselves run in
+    # order and their output stays readable
+    async with create_client() as client:
+        for example in (
+            # Real-world case study
+            saugeen_shores_case_study,
+            # Comparative analysis
+            comparative_analysis_example,
+        ):
+            try:
+                await example(client)
+            except Exception as e:
+                print(f"❌ Example failed: {e}")
 
     print("\n🎉 Demographic Analysis Examples Complete!")
     print(
@@ -9,38 +9,168 @@ It can test ranges of member IDs to find valid locations and their names.
 import asyncio
 import argparse
 import json
+import sqlite3
 import sys
-from typing import Optional, Any
+import time
+from pathlib import Path
+from collections.abc import AsyncIterator
+from typing import Optional, Any, Self
 
 # Add parent directory to path for imports
 sys.path.insert(0, ".")
 
+import numpy as np
+from tqdm import tqdm
+
 from statscan.wds.client import Client
+from statscan.wds.models.cube import Cube
 from httpx import Timeout
 
+from _http import create_client
+
+
+# Population threshold for discover_major_cities
+MAJOR_CITY_POPULATION = 100_000
 
 # Population measure constants for coordinate building
 POPULATION_2021 = 1
 PRIVATE_DWELLINGS_2021 = 2
 POPULATION_DENSITY_PER_KM2 = 3
 
+# Remaining eight dimensions of a geography/measure probe coordinate
+_COORD_SUFFIX = ".0" * 8
+
+# Maximum number of member-ID probes in flight at once during range discovery
+DEFAULT_MAX_CONCURRENCY = 20
+
+# Seconds between plain-text progress lines when stdout is not a terminal
+PROGRESS_INTERVAL = 5.0
+
+# On-disk cache of probe results (valid and invalid) so reruns skip known IDs
+DEFAULT_CACHE_PATH = "scratch/wds_probe_cache.sqlite"
+PROBE_CACHE_TTL = 30 * 24 * 60 * 60  # 30 days, in seconds
+
+
+def population_array(locations: list[dict[str, Any]]) -> np.ndarray:
+    """Collect the 2021 populations of discovered locations into an int64 array"""
+    return np.fromiter(
+        (loc["population_2021"] for loc in locations),
+        dtype=np.int64,
+        count=len(locations),
+    )
+
 
 class WDSGeographicDiscovery:
     """Tool for discovering WDS geographic member IDs"""
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        cache_path: Optional[str] = DEFAULT_CACHE_PATH,
+        refresh: bool = False,
+    ) -> None:
         self.client: Optional[Client] = None
         self.population_cube_id = 98100002
         self.discovered_locations: list[dict[str, Any]] = []
+        self.max_concurrency = max_concurrency
+        self._sem = asyncio.Semaphore(max_concurrency)
+        self._geo_member_ids: list[int] | None = None
+        self._geo_parents: dict[int, int | None] = {}  # member ID -> parent member ID
+        self.cube_meta: Optional[Cube] = None
+        self._coord_suffix = _COORD_SUFFIX
+        self.cache_path = cache_path
+        self.refresh = refresh  # re-probe everything, overwriting cached results
+        self._cache: Optional[sqlite3.Connection] = None
 
     async def initialize(self) -> None:
         """Initialize the WDS client"""
-        timeout = Timeout(30.0)
-        self.client = Client(timeout=timeout)
+        self.client = create_client(timeout=Timeout(30.0))
+
+        if self.cache_path:
+            Path(self.cache_path).parent.mkdir(parents=True, exist_ok=True)
+            self._cache = sqlite3.connect(self.cache_path)
+            self._cache.execute(
+                "CREATE TABLE IF NOT EXISTS probe ("
+                "pid INTEGER, coord TEXT, member_id INTEGER, value INTEGER, "
+                "ref_per TEXT, release_time TEXT, ts INTEGER, "
+                "PRIMARY KEY (pid, coord))"
+            )
+
+        # Pin the cube metadata up front so probes are shaped to the cube and
+        # later lookups never refetch it
+        await self._load_cube_metadata()
+
+    async def aclose(self) -> None:
+        """Close the WDS client, its connection pool and the probe cache"""
+        if self.client:
+            await self.client.aclose()
+            self.client = None
+        if self._cache:
+            self._cache.close()
+            self._cache = None
+
+    async def __aenter__(self) -> Self:
+        await self.initialize()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
 
     def build_coordinate(self, member_id: int, measure: int = POPULATION_2021) -> str:
         """Build coordinate string for testing"""
-        return f"{member_id}.{measure}.0.0.0.0.0.0.0.0"
+        return f"{member_id}.{measure}{self._coord_suffix}"
+
+    def _cached_probe(self, coordinate: str) -> tuple[bool, dict[str, Any] | None]:
+        """
+        Look up a probe result in the on-disk cache
+
+        Returns:
+            (hit, location_info) - location_info is None for a cached invalid ID
+        """
+        if self._cache is None or self.refresh:
+            return False, None
+
+        row = self._cache.execute(
+            "SELECT member_id, value, ref_per, release_time FROM probe "
+            "WHERE pid = ? AND coord = ? AND ts > ?",
+            (self.population_cube_id, coordinate, int(time.time()) - PROBE_CACHE_TTL),
+        ).fetchone()
+        if row is None:
+            return False, None
+
+        member_id, value, ref_per, release_time = row
+        if value is None:
+            return True, None
+        return True, {
+            "member_id": member_id,
+            "coordinate": coordinate,
+            "population_2021": value,
+            "reference_date": ref_per,
+            "release_time": release_time,
+            "valid": True,
+        }
+
+    def _store_probe(
+        self, member_id: int, coordinate: str, location_info: dict[str, Any] | None
+    ) -> None:
+        """Record a probe result (None for an invalid ID) in the on-disk cache"""
+        if self._cache is None:
+            return
+
+        info = location_info or {}
+        with self._cache:
+            self._cache.execute(
+                "INSERT OR REPLACE INTO probe VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    self.population_cube_id,
+                    coordinate,
+                    member_id,
+                    info.get("population_2021"),
+                    info.get("reference_date"),
+                    info.get("release_time"),
+                    int(time.time()),
+                ),
+            )
 
     async def test_member_id(
         self, member_id: int, verbose: bool = False
@@ -56,6 +186,17 @@ class WDSGeographicDiscovery:
 
         coordinate = self.build_coordinate(member_id)
 
+        hit, cached = self._cached_probe(coordinate)
+        if hit:
+            if verbose:
+                if cached:
+                    print(
+                        f"✅ {member_id}: Population = {cached['population_2021']:,} (cached)"
+                    )
+                else:
+                    print(f"❌ {member_id}: No data (cached)")
+            return cached
+
         try:
             data = await self.client.get_data_from_cube_pid_coord_and_latest_n_periods(
                 product_id=self.population_cube_id, coordinate=coordinate, n=1
@@ -73,11 +214,16 @@ class WDSGeographicDiscovery:
                     "valid": True,
                 }
 
+                self._store_probe(member_id, coordinate, location_info)
+
                 if verbose:
                     print(f"✅ {member_id}: Population = {int(point.value):,}")
 
                 return location_info
             else:
+                # Cache the negative result too; errors below are not cached
+                # since they may be transient
+                self._store_probe(member_id, coordinate, None)
                 if verbose:
                     print(f"❌ {member_id}: No data")
                 return None
@@ -87,59 +233,240 @@ class WDSGeographicDiscovery:
                 print(f"❌ {member_id}: Error - {str(e)[:50]}...")
             return None
 
-    async def discover_range(
+    async def _load_cube_metadata(self) -> Optional[Cube]:
+        """
+        Fetch the population cube's metadata once and fit probe coordinates to it
+
+        WDS coordinates always have 10 positions. Any real dimensions after
+        geography and measure get their first member ID; unused positions stay 0.
+
+        Returns:
+            The cube metadata, or None if it is unavailable
+        """
+        if self.cube_meta is not None or not self.client:
+            return self.cube_meta
+
+        try:
+            self.cube_meta = await self.client.get_cube_metadata(
+                product_id=self.population_cube_id
+            )
+        except Exception as e:
+            print(f"⚠️  Could not load cube metadata: {str(e)[:50]}...")
+            return None
+
+        dimensions = sorted(
+            self.cube_meta.dimensions or [], key=lambda dim: dim.dimensionPositionId
+        )
+        # A memberless dimension keeps its position with a "0" placeholder
+        extra = [
+            str(dim.member[0].memberId) if dim.member else "0"
+            for dim in dimensions[2:10]
+        ]
+        self._coord_suffix = "".join(f".{m}" for m in extra) + ".0" * (8 - len(extra))
+        return self.cube_meta
+
+    async def _load_geo_members(self) -> list[int] | None:
+        """
+        Load the geography member IDs published in the cube metadata
+
+        Returns:
+            Sorted list of member IDs, or None if the metadata is unavailable
+        """
+        if self._geo_member_ids is not None:
+            return self._geo_member_ids
+
+        cube = await self._load_cube_metadata()
+        if cube is None:
+            return None
+
+        geo_dim = next(
+            (
+                dim
+                for dim in cube.dimensions or []
+                if dim.dimensionNameEn.lower().startswith("geography")
+            ),
+            None,
+        )
+        if geo_dim is None:
+            print("⚠️  Could not load geography members: no geography dimension")
+            return None
+
+        self._geo_parents = {
+            member.memberId: member.parentMemberId for member in geo_dim.member
+        }
+        self._geo_member_ids = sorted(self._geo_parents)
+        return self._geo_member_ids
+
+    async def _probe(self, member_id: int) -> dict[str, Any] | None:
+        """Test a member ID, bounded by the concurrency limit"""
+        async with self._sem:
+            return await self.test_member_id(member_id, verbose=False)
+
+    async def idiscover_range(
         self, start_id: int, end_id: int, verbose: bool = True
-    ) -> list[dict[str, Any]]:
+    ) -> AsyncIterator[dict[str, Any]]:
         """
-        Discover valid member IDs in a range
+        Discover valid member IDs in a range, yielding each as soon as it is found
 
         Args:
             start_id: Starting member ID
             end_id: Ending member ID (inclusive)
             verbose: Print progress
 
-        Returns:
-            List of valid location info dictionaries
+        Yields:
+            Valid location info dictionaries, in completion order
         """
         print(f"🔍 Discovering member IDs in range {start_id} to {end_id}...")
 
-        valid_locations: list[dict[str, Any]] = []
+        # Only probe IDs the cube actually publishes; fall back to the full range
+        # when the member catalogue cannot be loaded
+        member_ids: list[int] | range = range(start_id, end_id + 1)
+        geo_members = await self._load_geo_members()
+        if geo_members is not None:
+            member_ids = [m for m in geo_members if start_id <= m <= end_id]
+            if verbose:
+                print(
+                    f"   {len(member_ids)} of {end_id - start_id + 1} IDs are published geography members"
+                )
+
+        total_found = 0
         total_tested = 0
 
-        for member_id in range(start_id, end_id + 1):
-            total_tested += 1
+        # Probe concurrently (bounded by the semaphore) and report as results arrive
+        tasks = [
+            asyncio.create_task(self._probe(member_id)) for member_id in member_ids
+        ]
+        # tqdm redraws on a timer rather than per probe. It disables itself when
+        # stdout is not a terminal (disable=None), e.g. in CI or when piped to a
+        # file; a progress line is then printed every PROGRESS_INTERVAL seconds.
+        progress = tqdm(
+            total=len(tasks),
+            desc="Probing",
+            unit="id",
+            disable=None if verbose else True,
+        )
+        status: asyncio.TimerHandle | None = None
+        if verbose and progress.disable:
+            loop = asyncio.get_running_loop()
 
-            if verbose and total_tested % 100 == 0:
+            def report_progress() -> None:
+                nonlocal status
                 print(
-                    f"   Tested {total_tested}/{end_id - start_id + 1} IDs, found {len(valid_locations)} valid"
+                    f"   Probed {total_tested}/{len(tasks)} IDs, {total_found} found"
                 )
+                status = loop.call_later(PROGRESS_INTERVAL, report_progress)
 
-            location_info = await self.test_member_id(member_id, verbose=False)
-            if location_info:
-                valid_locations.append(location_info)
-                if verbose:
-                    print(
-                        f"✅ Found {member_id}: Population = {location_info['population_2021']:,}"
-                    )
+            status = loop.call_later(PROGRESS_INTERVAL, report_progress)
+        try:
+            for fut in asyncio.as_completed(tasks):
+                location_info = await fut
+                total_tested += 1
+
+                if location_info:
+                    total_found += 1
+                    if verbose:
+                        tqdm.write(
+                            f"✅ Found {location_info['member_id']}: Population = {location_info['population_2021']:,}"
+                        )
+                    progress.set_postfix(found=total_found, refresh=False)
+                    yield location_info
+
+                progress.update()
+        finally:
+            if status is not None:
+                status.cancel()
+            progress.close()
+            # Don't leave probes running if the consumer stops early
+            for task in tasks:
+                task.cancel()
 
         print(
-            f"\\n📊 Discovery complete: {len(valid_locations)} valid locations found out of {total_tested} tested"
+            f"\\n📊 Discovery complete: {total_found} valid locations found out of {total_tested} tested"
         )
+
+    async def discover_range(
+        self, start_id: int, end_id: int, verbose: bool = True
+    ) -> list[dict[str, Any]]:
+        """
+        Discover valid member IDs in a range
+
+        Args:
+            start_id: Starting member ID
+            end_id: Ending member ID (inclusive)
+            verbose: Print progress
+
+        Returns:
+            List of valid location info dictionaries, ordered by member ID
+        """
+        valid_locations = [
+            loc async for loc in self.idiscover_range(start_id, end_id, verbose)
+        ]
+        valid_locations.sort(key=lambda x: x["member_id"])
         return valid_locations
 
-    async def discover_major_cities(self) -> list[dict[str, Any]]:
+    async def _discover_above(self, min_population: int) -> list[dict[str, Any]]:
+        """
+        Walk the geography hierarchy top-down, probing one level at a time
+
+        A sub-geography cannot have more people than the area containing it, so
+        the children of an area at or below min_population are never probed.
+        Areas with no data can't be ruled out, so their children are still probed.
+        """
+        children: dict[int | None, list[int]] = {}
+        for member_id, parent_id in self._geo_parents.items():
+            # Members whose parent is not published in the cube are treated as roots
+            root = parent_id if parent_id in self._geo_parents else None
+            children.setdefault(root, []).append(member_id)
+
+        locations: list[dict[str, Any]] = []
+        visited: set[int] = set()
+        frontier = children.get(None, [])
+        while frontier:
+            visited.update(frontier)
+            results = await asyncio.gather(
+                *(self._probe(member_id) for member_id in frontier)
+            )
+            next_frontier: list[int] = []
+            for member_id, location_info in zip(frontier, results):
+                if location_info:
+                    locations.append(location_info)
+                if (
+                    not location_info
+                    or location_info["population_2021"] > min_population
+                ):
+                    next_frontier.extend(
+                        child
+                        for child in children.get(member_id, [])
+                        if child not in visited
+                    )
+            frontier = next_frontier
+
+        print(
+            f"   Probed {len(visited)} of {len(self._geo_parents)} geography members"
+        )
+        return locations
+
+    async def discover_major_cities(
+        self, min_population: int = MAJOR_CITY_POPULATION
+    ) -> list[dict[str, Any]]:
         """
         Discover major cities by testing likely population ranges
 
         Major cities typically have populations > 100,000
         """
-        print("🏙️  Discovering major cities (population > 100,000)...")
+        print(f"🏙️  Discovering major cities (population > {min_population:,})...")
 
-        # Test a broader range to find major population centers
-        all_locations = await self.discover_range(1, 5000, verbose=False)
+        # Prune the search using the geography hierarchy when the cube metadata is
+        # available; otherwise test a broader range to find major population centers
+        if await self._load_geo_members() is not None:
+            all_locations = await self._discover_above(min_population)
+        else:
+            all_locations = await self.discover_range(1, 5000, verbose=False)
 
         # Filter for major cities
-        major_cities = [loc for loc in all_locations if loc["population_2021"] > 100000]
+        major_cities = [
+            loc for loc in all_locations if loc["population_2021"] > min_population
+        ]
 
         major_cities.sort(key=lambda x: x["population_2021"], reverse=True)
 
@@ -187,22 +514,15 @@ class WDSGeographicDiscovery:
     def generate_enum_code(self, locations: list[dict[str, Any]]) -> str:
         """Generate enum code for discovered locations"""
 
-        # Sort by population (largest first)
-        sorted_locations = sorted(
-            locations, key=lambda x: x["population_2021"], reverse=True
-        )
-
-        enum_entries = []
-        for loc in sorted_locations:
-            member_id = loc["member_id"]
-            population = loc["population_2021"]
+        # Sort by population (largest first); stable, so ties keep discovery order
+        order = np.argsort(-population_array(locations), kind="stable")
+        sorted_locations = [locations[i] for i in order]
 
-            # Generate a reasonable enum name (we don't have location names from API)
-            enum_name = f"LOCATION_{member_id}"
-
-            enum_entries.append(
-                f"    {enum_name} = {member_id}  # Population: {population:,}"
-            )
+        # Generate a reasonable enum name (we don't have location names from API)
+        enum_body = "\n".join(
+            f"    LOCATION_{loc['member_id']} = {loc['member_id']}  # Population: {loc['population_2021']:,}"
+            for loc in sorted_locations
+        )
 
         enum_code = f"""
 # Discovered WDS Geographic Locations
@@ -215,15 +535,16 @@ class DiscoveredWDSGeographic(IntEnum):
     These locations were discovered through API testing and validation.
     \"\"\"
     
-{chr(10).join(enum_entries)}
+{enum_body}
 """
 
         return enum_code
 
     def save_results(self, locations: list[dict[str, Any]], filename: str):
-        """Save discovery results to JSON file"""
+        """Save discovery results to a JSON Lines file (one location per line)"""
+        Path(filename).parent.mkdir(parents=True, exist_ok=True)
         with open(filename, "w") as f:
-            json.dump(locations, f, indent=2)
+            f.writelines(json.dumps(loc) + "\n" for loc in locations)
         print(f"💾 Results saved to {filename}")
 
 
@@ -257,8 +578,26 @@ async def main():
         "--output",
         "-o",
         type=str,
-        default="scratch/discovered_locations.json",
-        help="Output file for results (default: scratch/discovered_locations.json)",
+        default="scratch/discovered_locations.jsonl",
+        help="JSON Lines output file for results (default: scratch/discovered_locations.jsonl)",
+    )
+    parser.add_argument(
+        "--max-concurrency",
+        "-c",
+        type=int,
+        default=DEFAULT_MAX_CONCURRENCY,
+        help=f"Maximum concurrent member ID probes (default: {DEFAULT_MAX_CONCURRENCY})",
+    )
+    parser.add_argument(
+        "--cache",
+        type=str,
+        default=DEFAULT_CACHE_PATH,
+        help=f"SQLite cache of probe results (default: {DEFAULT_CACHE_PATH})",
+    )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Ignore cached probe results and re-test every member ID",
     )
     parser.add_argument(
         "--generate-enum",
@@ -269,53 +608,70 @@ async def main():
 
     args = parser.parse_args()
 
-    discovery = WDSGeographicDiscovery()
-    await discovery.initialize()
-
-    all_results = []
-
-    # Test specific ID
-    if args.test_id:
-        print(f"🧪 Testing member ID {args.test_id}...")
-        result = await discovery.test_member_id(args.test_id, verbose=True)
-        if result:
-            all_results.append(result)
-
-    # Test known locations
-    elif args.known or not any([args.range, args.major_cities, args.test_id]):
-        results = await discovery.test_known_locations()
-        all_results.extend(results)
-
-    # Test range
-    elif args.range:
-        start_id, end_id = args.range
-        results = await discovery.discover_range(start_id, end_id)
-        all_results.extend(results)
-
-    # Discover major cities
-    elif args.major_cities:
-        results = await discovery.discover_major_cities()
-        all_results.extend(results)
-
-    # Save results
-    if all_results:
-        discovery.save_results(all_results, args.output)
-
-        if args.generate_enum:
-            enum_code = discovery.generate_enum_code(all_results)
-            print("\\n📝 Generated enum code:")
-            print("=" * 60)
-            print(enum_code)
-
-    print("\\n🎯 Discovery Summary:")
-    print(f"   • Found {len(all_results)} valid locations")
-    if all_results:
-        total_population = sum(loc["population_2021"] for loc in all_results)
-        print(f"   • Total population: {total_population:,}")
-        max_pop = max(all_results, key=lambda x: x["population_2021"])
-        print(
-            f"   • Largest location: Member ID {max_pop['member_id']} ({max_pop['population_2021']:,} people)"
-        )
+    # One client (and connection pool) is shared by every discovery step
+    async with WDSGeographicDiscovery(
+        max_concurrency=args.max_concurrency,
+        cache_path=args.cache,
+        refresh=args.refresh,
+    ) as discovery:
+        all_results = []
+        streamed = False
+
+        # Test specific ID
+        if args.test_id:
+            print(f"🧪 Testing member ID {args.test_id}...")
+            result = await discovery.test_member_id(args.test_id, verbose=True)
+            if result:
+                all_results.append(result)
+
+        # Test known locations
+        elif args.known or not any([args.range, args.major_cities, args.test_id]):
+            results = await discovery.test_known_locations()
+            all_results.extend(results)
+
+        # Test range
+        elif args.range:
+            start_id, end_id = args.range
+            output = Path(args.output)
+            output.parent.mkdir(parents=True, exist_ok=True)
+            # Write each hit as it is found instead of serializing the whole sweep at the
+            # end; file I/O runs in a worker thread so the probes keep going meanwhile
+            f = await asyncio.to_thread(output.open, "w")
+            try:
+                async for loc in discovery.idiscover_range(start_id, end_id):
+                    await asyncio.to_thread(f.write, json.dumps(loc) + "\n")
+                    all_results.append(loc)
+            finally:
+                await asyncio.to_thread(f.close)
+            streamed = True
+            print(f"💾 Results saved to {args.output}")
+
+        # Discover major cities
+        elif args.major_cities:
+            results = await discovery.discover_major_cities()
+            all_results.extend(results)
+
+        # Save results
+        if all_results:
+            if not streamed:
+                await asyncio.to_thread(discovery.save_results, all_results, args.output)
+
+            if args.generate_enum:
+                enum_code = discovery.generate_enum_code(all_results)
+                print("\\n📝 Generated enum code:")
+                print("=" * 60)
+                print(enum_code)
+
+        print("\\n🎯 Discovery Summary:")
+        print(f"   • Found {len(all_results)} valid locations")
+        if all_results:
+            populations = population_array(all_results)
+            total_population = int(populations.sum())
+            print(f"   • Total population: {total_population:,}")
+            max_pop = all_results[int(populations.argmax())]
+            print(
+                f"   • Largest location: Member ID {max_pop['member_id']} ({max_pop['population_2021']:,} people)"
+            )
 
 
 if __name__ == "__main__":
@@ -1,10 +1,14 @@
-from importlib.metadata import packages_distributions, version
+from importlib.metadata import PackageNotFoundError, version
 from importlib.util import module_from_spec, spec_from_file_location
 from pathlib import Path
+from typing import Any
 
 # Explicitly declare the public API for this module
 __all__ = ["__version__"]
 
+# Distribution name from pyproject.toml (differs from the import name `statscan`)
+_DISTRIBUTION_NAME = "statistics-canada"
+
 
 def _initialize_version() -> str:
     """
@@ -15,10 +19,9 @@ def _initialize_version() -> str:
     """
     try:
         # This is the primary method: get the version from installed package metadata
-        dist_map = packages_distributions()
-        distribution_name = dist_map[__name__][0]
-        return version(distribution_name)
-    except (KeyError, IndexError):
+        # (a direct lookup, rather than scanning every installed distribution)
+        return version(_DISTRIBUTION_NAME)
+    except PackageNotFoundError:
         # This is the fallback for development scenarios
         repo_root = Path(__file__).parent.parent
         version_file_path = repo_root / "_version.py"
@@ -37,5 +40,12 @@ def _initialize_version() -> str:
             return 'unknown-no-version-attribute'
         except Exception:
             return 'unknown-exec-error'
-        
-__version__ = _initialize_version()
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve `__version__` on first access (PEP 562) so plain imports skip the lookup."""
+    if name == "__version__":
+        value = globals()["__version__"] = _initialize_version()
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
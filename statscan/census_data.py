@@ -9,11 +9,14 @@ into more user-friendly formats including pandas DataFrames.
     Use statscan.sdmx.response.SDMXResponse instead.
 """
 
+import re
 import warnings
+from functools import cache, cached_property
 from typing import Any, Optional, ClassVar, Self
 
 from dataclasses import dataclass
 
+import numpy as np
 import pandas as pd
 
 from statscan.enums.stats_filter import (
@@ -33,7 +36,73 @@ warnings.warn(
 )
 
 
-@dataclass
+# (lower-cased display name, category) per characteristic, in definition order
+_CHARACTERISTIC_CATEGORIES: tuple[tuple[str, str], ...] = tuple(
+    (member.name.replace("_", " ").lower(), member.category)
+    for member in CensusProfileCharacteristic
+)
+
+
+@cache
+def _enum_title(enum_value: Any) -> str:
+    """Title-cased display name of an enum member (e.g. TOTAL_GENDER -> 'Total Gender')."""
+    return enum_value.name.replace("_", " ").title()
+
+
+def _rule(pattern: str) -> re.Pattern[str]:
+    return re.compile(pattern, re.IGNORECASE | re.DOTALL)
+
+
+# Dimension-name term -> ordered (pattern, enum value) rules used by
+# CensusData._map_to_enum_value; the first dimension term found in the dimension
+# name selects the rule set and the first matching pattern wins.
+_ENUM_RULES: dict[str, tuple[tuple[re.Pattern[str], Any], ...]] = {
+    "gender": (
+        (_rule(r"total|both|all|men\+|women\+|persons"), Gender.TOTAL_GENDER),
+        (_rule(r"^(?!.*female).*(?:male|men)"), Gender.MALE),
+        (_rule(r"female|women"), Gender.FEMALE),
+    ),
+    "statistic": (
+        (_rule(r"count|number"), StatisticType.COUNT),
+        (_rule(r"percent"), StatisticType.PERCENTAGE),
+        (_rule(r"rate"), StatisticType.RATE),
+        (_rule(r"median"), StatisticType.MEDIAN),
+        (_rule(r"average|mean"), StatisticType.AVERAGE),
+        (_rule(r"ratio"), StatisticType.RATIO),
+        (_rule(r"index"), StatisticType.INDEX),
+    ),
+    "characteristic": (
+        (
+            _rule(
+                r"^(?!.*density)(?=.*population)(?:.*(?:total|count)|\s*population\s*\Z)"
+            ),
+            CensusProfileCharacteristic.POPULATION_COUNT,
+        ),
+        (
+            _rule(r"population density|density per"),
+            CensusProfileCharacteristic.POPULATION_DENSITY_PER_KM2,
+        ),
+        (_rule(r"median age"), CensusProfileCharacteristic.MEDIAN_AGE),
+        (_rule(r"average age"), CensusProfileCharacteristic.AVERAGE_AGE),
+        (_rule(r"total households"), CensusProfileCharacteristic.TOTAL_HOUSEHOLDS),
+        (
+            _rule(r"household size"),
+            CensusProfileCharacteristic.AVERAGE_HOUSEHOLD_SIZE,
+        ),
+        (_rule(r"total dwellings"), CensusProfileCharacteristic.TOTAL_DWELLINGS),
+        (
+            _rule(r"median (?:total )?household income"),
+            CensusProfileCharacteristic.MEDIAN_HOUSEHOLD_INCOME,
+        ),
+        (
+            _rule(r"average (?:total )?household income"),
+            CensusProfileCharacteristic.AVERAGE_HOUSEHOLD_INCOME,
+        ),
+    ),
+}
+
+
+@dataclass(slots=True)
 class DimensionInfo:
     """Information about a single dimension in SDMX data."""
 
@@ -54,7 +123,7 @@ class DimensionInfo:
         return str(index)
 
 
-@dataclass
+@dataclass(slots=True)
 class SeriesInfo:
     """Information about a data series in SDMX response."""
 
@@ -67,6 +136,11 @@ class SeriesInfo:
         """Get a human-readable summary of series dimensions."""
         return " | ".join([f"{k}: {v}" for k, v in self.dimensions.items()])
 
+    @property
+    def dimensions_lower(self) -> dict[str, str]:
+        """Lower-cased dimension values for case-insensitive matching."""
+        return {k: str(v).lower() for k, v in self.dimensions.items()}
+
 
 class CensusData:
     """
@@ -78,6 +152,30 @@ class CensusData:
     """
 
     COMMON_FILTERS: ClassVar[type] = CommonFilters
+    _METADATA_COLS: ClassVar[frozenset[str]] = frozenset(
+        {"series_key", "time_period", "value"}
+    )
+    # characteristic keyword patterns for the get_*_data helpers, compiled once
+    _INCOME_RE: ClassVar[re.Pattern[str]] = re.compile(
+        r"income|earning|wage|salary", re.IGNORECASE
+    )
+    _EDUCATION_RE: ClassVar[re.Pattern[str]] = re.compile(
+        r"education|school|degree|diploma|certificate", re.IGNORECASE
+    )
+    _EMPLOYMENT_RE: ClassVar[re.Pattern[str]] = re.compile(
+        r"employment|labour|work|job|occupation", re.IGNORECASE
+    )
+    _DWELLING_RE: ClassVar[re.Pattern[str]] = re.compile(
+        r"dwelling|housing|house|apartment|home", re.IGNORECASE
+    )
+    # values derived from the DataFrame, computed once and dropped when it is replaced
+    _DERIVED_ATTRS: ClassVar[tuple[str, ...]] = (
+        "_dimension_cols",
+        "_char_col",
+        "_stat_col",
+        "dimensions",
+        "series_info",
+    )
 
     def __init__(self, dataframe: pd.DataFrame):
         """
@@ -89,6 +187,12 @@ class CensusData:
         """
         self._dataframe = dataframe
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name == "_dataframe":
+            for attr in self._DERIVED_ATTRS:
+                self.__dict__.pop(attr, None)
+
     @property
     def dataframe(self) -> pd.DataFrame:
         """
@@ -100,22 +204,47 @@ class CensusData:
         """
         return self._dataframe
 
-    @property
+    @cached_property
+    def _dimension_cols(self) -> list[str]:
+        """All dimension columns of the DataFrame (everything but the metadata columns)."""
+        return [
+            col for col in self._dataframe.columns if col not in self._METADATA_COLS
+        ]
+
+    def _find_col(self, term: str) -> Optional[str]:
+        """First column whose name contains `term` (case-insensitive), if any."""
+        return next(
+            (col for col in self._dataframe.columns if term in col.lower()), None
+        )
+
+    @cached_property
+    def _char_col(self) -> Optional[str]:
+        """The characteristic dimension column, if present."""
+        return self._find_col("characteristic")
+
+    @cached_property
+    def _stat_col(self) -> Optional[str]:
+        """The statistic dimension column, if present."""
+        return self._find_col("statistic")
+
+    @cached_property
     def dimensions(self) -> dict[str, DimensionInfo]:
-        """Extract dimension information from the DataFrame."""
+        """Extract dimension information from the DataFrame (computed once per DataFrame)."""
         dimensions = {}
 
-        # Get all dimension columns (exclude metadata columns)
-        metadata_cols = {"series_key", "time_period", "value"}
-        dimension_cols = [
-            col for col in self._dataframe.columns if col not in metadata_cols
-        ]
-
-        for col in dimension_cols:
-            unique_values = self._dataframe[col].dropna().unique()
-            values = []
-            for i, value in enumerate(unique_values):
-                values.append({"id": str(i), "name": str(value)})
+        for col in self._dimension_cols:
+            column = self._dataframe[col]
+            if isinstance(column.dtype, pd.CategoricalDtype):
+                # Values are already materialized as categories: take the ones in use,
+                # in order of appearance, from the integer codes (-1 marks missing)
+                codes = pd.unique(column.cat.codes.to_numpy())
+                unique_values = column.cat.categories.take(codes[codes >= 0])
+            else:
+                unique_values = pd.Index(column.dropna().unique())
+            values = [
+                {"id": str(i), "name": str(value)}
+                for i, value in enumerate(unique_values)
+            ]
 
             dimensions[col] = DimensionInfo(
                 id=col.lower().replace(" ", "_"), name=col, values=values
@@ -123,45 +252,50 @@ class CensusData:
 
         return dimensions
 
-    @property
+    @cached_property
     def series_info(self) -> list[SeriesInfo]:
-        """Extract series information from the DataFrame."""
+        """Extract series information from the DataFrame (computed once per DataFrame)."""
         series_list: list[SeriesInfo] = []
 
         if "series_key" not in self._dataframe.columns:
             return series_list
 
-        # Group by series_key to get observations for each series
-        metadata_cols = {"series_key", "time_period", "value"}
-        dimension_cols = [
-            col for col in self._dataframe.columns if col not in metadata_cols
-        ]
-
-        for series_key, group in self._dataframe.groupby("series_key"):
-            # Get dimensions for this series (should be consistent within a series)
-            dimensions = {}
-            if not group.empty:
-                first_row = group.iloc[0]
-                for col in dimension_cols:
-                    if pd.notna(first_row[col]):
-                        dimensions[col] = str(first_row[col])
-
-            # Get observations (time_period -> value mapping)
-            observations = {}
-            if "time_period" in group.columns and "value" in group.columns:
-                for _, row in group.iterrows():
-                    if pd.notna(row["time_period"]) and pd.notna(row["value"]):
-                        observations[str(row["time_period"])] = row["value"]
-
-            series_list.append(
-                SeriesInfo(
-                    key=str(series_key),
-                    dimensions=dimensions,
-                    observations=observations,
-                )
+        df = self._dataframe
+        keyed = df[df["series_key"].notna()]
+
+        # Dimensions come from the first row of each series, in order of appearance
+        # (they should be consistent within a series); missing values are left out
+        first_rows = keyed.drop_duplicates("series_key")
+        keys = first_rows["series_key"].astype(str).tolist()
+        dimension_values = [
+            (
+                str(col),
+                first_rows[col].notna().tolist(),
+                first_rows[col].astype(str).tolist(),
             )
+            for col in self._dimension_cols
+        ]
+        dimensions: list[dict[str, str]] = [{} for _ in keys]
+        for col, present, values in dimension_values:
+            for dims, is_present, value in zip(dimensions, present, values):
+                if is_present:
+                    dims[col] = value
+
+        # Observations (time_period -> value) from every complete row, in one pass
+        observations: dict[str, dict[str, float | str]] = {key: {} for key in keys}
+        if {"time_period", "value"}.issubset(df.columns):
+            obs = keyed.dropna(subset=["time_period", "value"])
+            for key, period, value in zip(
+                obs["series_key"].astype(str).tolist(),
+                obs["time_period"].astype(str).tolist(),
+                obs["value"].tolist(),
+            ):
+                observations[key][period] = value
 
-        return series_list
+        return [
+            SeriesInfo(key=key, dimensions=dims, observations=observations[key])
+            for key, dims in zip(keys, dimensions)
+        ]
 
     @classmethod
     def from_raw_response(cls, raw_response: dict[str, Any]) -> "CensusData":
@@ -188,25 +322,21 @@ class CensusData:
     @staticmethod
     def _parse_dimensions(raw_response: dict[str, Any]) -> dict[str, DimensionInfo]:
         """Parse dimension information from raw response."""
-        dimensions = {}
-
-        # Try different possible locations for dimensions in SDMX structure
-        structures = None
-        if "data" in raw_response:
-            if "structures" in raw_response["data"]:
-                structures = raw_response["data"]["structures"]
-
-        if structures and len(structures) > 0:
-            dims = structures[0].get("dimensions", {})
-            if "series" in dims:
-                for i, dim in enumerate(dims["series"]):
-                    dim_id = dim.get("id", f"dim_{i}")
-                    dim_name = dim.get("name", dim_id)
-                    dim_values = dim.get("values", [])
-
-                    dimensions[dim_name] = DimensionInfo(
-                        id=dim_id, name=dim_name, values=dim_values
-                    )
+        dimensions: dict[str, DimensionInfo] = {}
+
+        # Dimensions live under data.structures[0].dimensions.series in SDMX-JSON
+        structures = (raw_response.get("data") or {}).get("structures")
+        if not structures:
+            return dimensions
+
+        dims = structures[0].get("dimensions") or {}
+        for i, dim in enumerate(dims.get("series") or ()):
+            dim_get = dim.get
+            dim_id = dim_get("id", f"dim_{i}")
+            dim_name = dim_get("name", dim_id)
+            dimensions[dim_name] = DimensionInfo(
+                id=dim_id, name=dim_name, values=dim_get("values", [])
+            )
 
         return dimensions
 
@@ -215,31 +345,70 @@ class CensusData:
         raw_response: dict[str, Any], dimensions: dict[str, DimensionInfo]
     ) -> list[SeriesInfo]:
         """Parse series data with decoded dimensions."""
-        series_info = []
-
-        if "data" in raw_response and "dataSets" in raw_response["data"]:
-            datasets = raw_response["data"]["dataSets"]
-            if len(datasets) > 0 and "series" in datasets[0]:
-                series_data = datasets[0]["series"]
+        datasets = (raw_response.get("data") or {}).get("dataSets")
+        if not datasets:
+            return []
+        series_data = datasets[0].get("series")
+        if series_data is None:
+            return []
+
+        # Decode all series keys at once using dimensions
+        all_decoded = CensusData._decode_series_keys(
+            list(series_data.keys()), dimensions
+        )
 
-                for series_key, series_values in series_data.items():
-                    # Decode series key using dimensions
-                    decoded_dimensions = CensusData._decode_series_key(
-                        series_key, dimensions
-                    )
+        return [
+            SeriesInfo(
+                key=series_key,
+                dimensions=decoded_dimensions,
+                observations=series_values.get("observations", {}),
+            )
+            for (series_key, series_values), decoded_dimensions in zip(
+                series_data.items(), all_decoded
+            )
+        ]
 
-                    # Extract observations
-                    observations = series_values.get("observations", {})
+    @staticmethod
+    def _decode_series_keys(
+        series_keys: list[str], dimensions: dict[str, DimensionInfo]
+    ) -> list[dict[str, Any]]:
+        """
+        Decode many series keys at once.
 
-                    series_info.append(
-                        SeriesInfo(
-                            key=series_key,
-                            dimensions=decoded_dimensions,
-                            observations=observations,
-                        )
-                    )
+        Each dimension's values are decoded (and mapped to enums) once, then gathered
+        for every key with a NumPy index, instead of decoding every key part separately.
+        Falls back to _decode_series_key for ragged, non-integer or out-of-range keys.
+        """
+        dim_names = list(dimensions.keys())
 
-        return series_info
+        def decode_each() -> list[dict[str, Any]]:
+            return [CensusData._decode_series_key(k, dimensions) for k in series_keys]
+
+        if not series_keys or not dim_names:
+            return decode_each()
+        try:
+            codes = np.array([k.split(":") for k in series_keys], dtype=np.intp)
+        except ValueError:
+            return decode_each()
+
+        n_dims = min(codes.shape[1], len(dim_names))
+        columns = []
+        for i, dim_name in enumerate(dim_names[:n_dims]):
+            dim_info = dimensions[dim_name]
+            col = codes[:, i]
+            if col.min() < 0 or col.max() >= len(dim_info.values):
+                return decode_each()
+            lookup = np.empty(len(dim_info.values), dtype=object)
+            for j in range(len(dim_info.values)):
+                name = dim_info.get_value_name(j)
+                enum_value = CensusData._map_to_enum_value(dim_name, name)
+                lookup[j] = enum_value if enum_value is not None else name
+            columns.append(lookup[col])
+
+        if not columns:
+            return [{} for _ in series_keys]
+        names = dim_names[:n_dims]
+        return [dict(zip(names, row)) for row in zip(*columns)]
 
     @staticmethod
     def _decode_series_key(
@@ -279,88 +448,14 @@ class CensusData:
         if not human_readable_value:
             return None
 
-        value_lower = human_readable_value.lower()
-
-        # Map Gender dimension
-        if "gender" in dimension_name.lower():
-            if (
-                "total" in value_lower
-                or "both" in value_lower
-                or "all" in value_lower
-                or "men+" in value_lower
-                or "women+" in value_lower
-                or "persons" in value_lower
-            ):
-                return Gender.TOTAL_GENDER
-            elif (
-                "male" in value_lower or "men" in value_lower
-            ) and "female" not in value_lower:
-                return Gender.MALE
-            elif "female" in value_lower or "women" in value_lower:
-                return Gender.FEMALE
-
-        # Map Statistic dimension
-        elif "statistic" in dimension_name.lower():
-            if (
-                "count" in value_lower
-                or "number" in value_lower
-                or "counts" in value_lower
-            ):
-                return StatisticType.COUNT
-            elif "percentage" in value_lower or "percent" in value_lower:
-                return StatisticType.PERCENTAGE
-            elif "rate" in value_lower or "rates" in value_lower:
-                return StatisticType.RATE
-            elif "median" in value_lower:
-                return StatisticType.MEDIAN
-            elif "average" in value_lower or "mean" in value_lower:
-                return StatisticType.AVERAGE
-            elif "ratio" in value_lower:
-                return StatisticType.RATIO
-            elif "index" in value_lower:
-                return StatisticType.INDEX
-
-        # Map Census Profile Characteristic dimension (basic mapping for common ones)
-        elif "characteristic" in dimension_name.lower():
-            if (
-                "population" in value_lower
-                and "density" not in value_lower
-                and (
-                    "total" in value_lower
-                    or "count" in value_lower
-                    or value_lower.strip() == "population"
-                )
-            ):
-                return CensusProfileCharacteristic.POPULATION_COUNT
-            elif "population density" in value_lower or "density per" in value_lower:
-                return CensusProfileCharacteristic.POPULATION_DENSITY_PER_KM2
-            elif "median age" in value_lower:
-                return CensusProfileCharacteristic.MEDIAN_AGE
-            elif "average age" in value_lower:
-                return CensusProfileCharacteristic.AVERAGE_AGE
-            elif "total households" in value_lower or (
-                value_lower.strip() == "households" and "total" in value_lower
-            ):
-                return CensusProfileCharacteristic.TOTAL_HOUSEHOLDS
-            elif (
-                "average household size" in value_lower
-                or "household size" in value_lower
-            ):
-                return CensusProfileCharacteristic.AVERAGE_HOUSEHOLD_SIZE
-            elif "total dwellings" in value_lower or (
-                value_lower.strip() == "dwellings" and "total" in value_lower
-            ):
-                return CensusProfileCharacteristic.TOTAL_DWELLINGS
-            elif (
-                "median household income" in value_lower
-                or "median total household income" in value_lower
-            ):
-                return CensusProfileCharacteristic.MEDIAN_HOUSEHOLD_INCOME
-            elif (
-                "average household income" in value_lower
-                or "average total household income" in value_lower
-            ):
-                return CensusProfileCharacteristic.AVERAGE_HOUSEHOLD_INCOME
+        # Pick the rule set for this dimension, then return the first matching enum
+        dimension_lower = dimension_name.lower()
+        for dimension_term, rules in _ENUM_RULES.items():
+            if dimension_term in dimension_lower:
+                for pattern, enum_value in rules:
+                    if pattern.search(human_readable_value):
+                        return enum_value
+                break
 
         # Return None if no mapping found - keep original human-readable value
         return None
@@ -379,47 +474,65 @@ class CensusData:
         Returns:
             DataFrame with meaningful dimension columns plus time periods and values
         """
-        rows = []
+        # Build column-major lists directly (one entry per observation) rather than
+        # a list of row dicts that pandas would have to union and transpose
+        columns: dict[str, list[Any]] = {}
+        n_rows = 0
+
+        def column(name: str) -> list[Any]:
+            col = columns.get(name)
+            if col is None:
+                # new column: earlier rows are missing this dimension
+                col = columns[name] = [None] * n_rows
+            return col
 
         for series in series_info:
-            # Start with meaningful dimension names
-            base_row = series.dimensions.copy()
-            base_row["series_key"] = series.key
+            n_obs = len(series.observations)
+            if not n_obs:
+                continue
+
+            # Start with meaningful dimension names, repeated for every observation
+            for name, value in series.dimensions.items():
+                column(name).extend([value] * n_obs)
+            column("series_key").extend([series.key] * n_obs)
 
             # Add series key components as separate columns for advanced analysis
             key_components = series.key.split(":")
             for i, component in enumerate(key_components):
-                base_row[f"dimension_{i}"] = component
+                column(f"dimension_{i}").extend([component] * n_obs)
 
-            for time_period, value in series.observations.items():
-                row: dict[str, str | float] = {}
-                row.update(base_row)
-                row["time_period"] = time_period
-                row["value"] = value
-                rows.append(row)
+            column("time_period").extend(series.observations.keys())
+            column("value").extend(series.observations.values())
+            n_rows += n_obs
 
-        df = pd.DataFrame(rows)
+            if len(series.dimensions) + len(key_components) + 3 != len(columns):
+                # pad columns this series does not have
+                for col in columns.values():
+                    col.extend([None] * (n_rows - len(col)))
 
-        # Reorder columns: meaningful dimensions first, then dimension components, then metadata
+        # Order columns: meaningful dimensions first, then dimension components, then metadata
+        metadata_cols = ["series_key", "time_period", "value"]
         meaningful_dims = [
             col
-            for col in df.columns
-            if col not in ["series_key", "time_period", "value"]
-            and not col.startswith("dimension_")
+            for col in columns
+            if col not in metadata_cols and not col.startswith("dimension_")
         ]
-        dimension_components = [
-            col for col in df.columns if col.startswith("dimension_")
+        dimension_components = [col for col in columns if col.startswith("dimension_")]
+        ordered_cols = [
+            col
+            for col in (*meaningful_dims, *dimension_components, *metadata_cols)
+            if col in columns
         ]
-        metadata_cols = ["series_key", "time_period", "value"]
-
-        # Ensure all columns exist before reordering
-        available_cols = []
-        for col_group in [meaningful_dims, dimension_components, metadata_cols]:
-            for col in col_group:
-                if col in df.columns:
-                    available_cols.append(col)
+        df = pd.DataFrame({col: columns[col] for col in ordered_cols})
 
-        return df[available_cols] if available_cols else df
+        # Dimension values and keys repeat across rows, so store them as categoricals:
+        # comparisons and groupbys then work on integer codes instead of rehashing objects
+        categorical_cols = [
+            col
+            for col in (*meaningful_dims, *dimension_components, "series_key")
+            if col in df.columns
+        ]
+        return df.astype(dict.fromkeys(categorical_cols, "category"))
 
     @classmethod
     def from_dataframe(cls, dataframe: pd.DataFrame) -> Self:
@@ -455,30 +568,24 @@ class CensusData:
         Returns:
             List of SeriesInfo matching the filters
         """
+        # Lower-case the query once and each series' dimensions once per call
+        gender_lower = gender.lower() if gender else None
+        char_lower = characteristic.lower() if characteristic else None
+        stat_lower = statistic_type.lower() if statistic_type else None
+
         filtered = []
 
         for series in self.series_info:
-            matches = True
-
-            if gender and series.dimensions.get("Gender", "").lower() != gender.lower():
-                matches = False
-            if (
-                characteristic
-                and characteristic.lower()
-                not in series.dimensions.get(
-                    "Census Profile Characteristic", ""
-                ).lower()
-            ):
-                matches = False
-            if (
-                statistic_type
-                and series.dimensions.get("Statistic Type", "").lower()
-                != statistic_type.lower()
+            dims = series.dimensions_lower
+            if gender_lower and dims.get("Gender", "") != gender_lower:
+                continue
+            if char_lower and char_lower not in dims.get(
+                "Census Profile Characteristic", ""
             ):
-                matches = False
-
-            if matches:
-                filtered.append(series)
+                continue
+            if stat_lower and dims.get("Statistic Type", "") != stat_lower:
+                continue
+            filtered.append(series)
 
         return filtered
 
@@ -486,65 +593,28 @@ class CensusData:
         """
         Filter series using StatsFilter with enum values.
 
+        Matching is done on the DataFrame (see filter_by_stats_filter): dimension values
+        equal to the enum, or containing its name, are kept. A filter on a dimension
+        the data does not have matches no series.
+
         Args:
             stats_filter: StatsFilter with enum-based filtering
 
         Returns:
             List of SeriesInfo matching the filter
         """
-        filtered = []
-
-        for series in self.series_info:
-            matches = True
-
-            # Check gender filter - now supports both enum values and string matching
-            if stats_filter.gender:
-                series_gender = series.dimensions.get("Gender", "")
-                # Check if the stored value is already the enum
-                if series_gender == stats_filter.gender:
-                    pass  # Direct match
-                else:
-                    # Fallback to string matching for backward compatibility
-                    gender_name = stats_filter.gender.name.replace("_", " ").title()
-                    if gender_name.lower() not in str(series_gender).lower():
-                        matches = False
-
-            # Check characteristic filter - now supports both enum values and string matching
-            if stats_filter.census_profile_characteristic:
-                series_char = series.dimensions.get(
-                    "Characteristic", ""
-                ) or series.dimensions.get("Census Profile Characteristic", "")
-                # Check if the stored value is already the enum
-                if series_char == stats_filter.census_profile_characteristic:
-                    pass  # Direct match
-                else:
-                    # Fallback to string matching for backward compatibility
-                    char_name = stats_filter.census_profile_characteristic.name.replace(
-                        "_", " "
-                    ).title()
-                    if char_name.lower() not in str(series_char).lower():
-                        matches = False
-
-            # Check statistic type filter - now supports both enum values and string matching
-            if stats_filter.statistic_type:
-                series_stat = series.dimensions.get(
-                    "Statistic", ""
-                ) or series.dimensions.get("Statistic Type", "")
-                # Check if the stored value is already the enum
-                if series_stat == stats_filter.statistic_type:
-                    pass  # Direct match
-                else:
-                    # Fallback to string matching for backward compatibility
-                    stat_name = stats_filter.statistic_type.name.replace(
-                        "_", " "
-                    ).title()
-                    if stat_name.lower() not in str(series_stat).lower():
-                        matches = False
-
-            if matches:
-                filtered.append(series)
-
-        return filtered
+        columns = self._dataframe.columns
+        if "series_key" not in columns:
+            return []
+        if (
+            (stats_filter.gender and "Gender" not in columns)
+            or (stats_filter.census_profile_characteristic and self._char_col is None)
+            or (stats_filter.statistic_type and self._stat_col is None)
+        ):
+            return []
+        matched = self.filter_by_stats_filter(stats_filter)
+        keys = set(matched["series_key"].astype(str).unique())
+        return [series for series in self.series_info if series.key in keys]
 
     def get_characteristics_by_category(self) -> dict[str, list[str]]:
         """
@@ -554,41 +624,66 @@ class CensusData:
             Dict mapping category names to lists of characteristics
         """
         characteristics: dict[str, list[str]] = {}
+        seen: set[str] = set()
 
         for series in self.series_info:
             char = series.dimensions.get("Census Profile Characteristic", "")
-            if char:
+            # Many series share a characteristic: categorize each distinct one once
+            if char and char not in seen:
+                seen.add(char)
                 # Try to match with known enum values to get category
-                category = "Other"
-                for enum_char in CensusProfileCharacteristic:
-                    if enum_char.name.replace("_", " ").lower() in char.lower():
-                        category = enum_char.category
-                        break
-
-                if category not in characteristics:
-                    characteristics[category] = []
-                if char not in characteristics[category]:
-                    characteristics[category].append(char)
+                char_lower = char.lower()
+                category = next(
+                    (
+                        category
+                        for name, category in _CHARACTERISTIC_CATEGORIES
+                        if name in char_lower
+                    ),
+                    "Other",
+                )
+                characteristics.setdefault(category, []).append(char)
 
         return characteristics
 
     # DataFrame filtering and analysis methods
-    def filter_by_gender(self, gender: str) -> pd.DataFrame:
-        """Filter data by gender."""
+    def filter_by_gender(self, gender: str, exact: bool = False) -> pd.DataFrame:
+        """
+        Filter data by gender.
+
+        Args:
+            gender: Case-insensitive pattern to search for in the gender values
+            exact: Only keep rows whose gender equals `gender` (no pattern matching;
+                   on categorical columns this compares category codes)
+        """
         df = self.dataframe
         if "Gender" in df.columns:
-            return df[df["Gender"].str.contains(gender, case=False, na=False)]
+            return self._filter_col(df, "Gender", gender, exact)
         return df
 
-    def filter_by_characteristic(self, characteristic: str) -> pd.DataFrame:
-        """Filter data by census characteristic."""
+    def filter_by_characteristic(
+        self, characteristic: str, exact: bool = False
+    ) -> pd.DataFrame:
+        """
+        Filter data by census characteristic.
+
+        Args:
+            characteristic: Case-insensitive pattern to search for in the characteristic values
+            exact: Only keep rows whose characteristic equals `characteristic`
+        """
         df = self.dataframe
-        char_cols = [col for col in df.columns if "characteristic" in col.lower()]
-        if char_cols:
-            col = char_cols[0]
-            return df[df[col].str.contains(characteristic, case=False, na=False)]
+        if (col := self._char_col) is not None:
+            return self._filter_col(df, col, characteristic, exact)
         return df
 
+    @staticmethod
+    def _filter_col(
+        df: pd.DataFrame, col: str, value: Any, exact: bool
+    ) -> pd.DataFrame:
+        """Rows of `df` whose `col` equals `value` (exact) or contains it as a pattern."""
+        if exact:
+            return df[df[col] == value]
+        return df[df[col].str.contains(value, case=False, na=False)]
+
     def get_population_data(self) -> pd.DataFrame:
         """Get only population-related data."""
         return self.filter_by_characteristic("population")
@@ -601,64 +696,41 @@ class CensusData:
         """Get only household-related data."""
         return self.filter_by_characteristic("household")
 
-    def get_income_data(self) -> pd.DataFrame:
-        """Get income-related data."""
-        income_terms = ["income", "earning", "wage", "salary"]
+    def _filter_characteristic_re(self, pattern: re.Pattern[str]) -> pd.DataFrame:
+        """Filter data to rows whose characteristic matches a precompiled pattern."""
         df = self.dataframe
-        char_cols = [col for col in df.columns if "characteristic" in col.lower()]
-        if char_cols:
-            mask = df[char_cols[0]].str.contains(
-                "|".join(income_terms), case=False, na=False
-            )
-            return df[mask]
+        if (col := self._char_col) is not None:
+            return df[df[col].str.contains(pattern, na=False)]
         return df
 
+    def get_income_data(self) -> pd.DataFrame:
+        """Get income-related data."""
+        return self._filter_characteristic_re(self._INCOME_RE)
+
     def get_education_data(self) -> pd.DataFrame:
         """Get education-related data."""
-        education_terms = ["education", "school", "degree", "diploma", "certificate"]
-        df = self.dataframe
-        char_cols = [col for col in df.columns if "characteristic" in col.lower()]
-        if char_cols:
-            mask = df[char_cols[0]].str.contains(
-                "|".join(education_terms), case=False, na=False
-            )
-            return df[mask]
-        return df
+        return self._filter_characteristic_re(self._EDUCATION_RE)
 
     def get_employment_data(self) -> pd.DataFrame:
         """Get employment-related data."""
-        employment_terms = ["employment", "labour", "work", "job", "occupation"]
-        df = self.dataframe
-        char_cols = [col for col in df.columns if "characteristic" in col.lower()]
-        if char_cols:
-            mask = df[char_cols[0]].str.contains(
-                "|".join(employment_terms), case=False, na=False
-            )
-            return df[mask]
-        return df
+        return self._filter_characteristic_re(self._EMPLOYMENT_RE)
 
     def get_dwelling_data(self) -> pd.DataFrame:
         """Get dwelling and housing-related data."""
-        dwelling_terms = ["dwelling", "housing", "house", "apartment", "home"]
-        df = self.dataframe
-        char_cols = [col for col in df.columns if "characteristic" in col.lower()]
-        if char_cols:
-            mask = df[char_cols[0]].str.contains(
-                "|".join(dwelling_terms), case=False, na=False
-            )
-            return df[mask]
-        return df
+        return self._filter_characteristic_re(self._DWELLING_RE)
 
     def pivot_by_gender(self) -> pd.DataFrame:
         """Pivot data to show gender breakdown by characteristic."""
         df = self.dataframe
         if "Gender" in df.columns and "value" in df.columns:
-            char_col = next(
-                (col for col in df.columns if "characteristic" in col.lower()), None
-            )
+            char_col = self._char_col
             if char_col:
                 return df.pivot_table(
-                    index=char_col, columns="Gender", values="value", aggfunc="first"
+                    index=char_col,
+                    columns="Gender",
+                    values="value",
+                    aggfunc="first",
+                    observed=True,
                 )
         return pd.DataFrame()
 
@@ -695,56 +767,69 @@ class CensusData:
             Filtered DataFrame
         """
         df = self.dataframe
+        filters = (
+            (gender, "Gender" if "Gender" in df.columns else None),
+            (characteristic, self._char_col),
+            (statistic_type, self._stat_col),
+        )
 
-        if gender:
-            if "Gender" in df.columns:
-                # Filter by enum value directly (more efficient) or fallback to name matching
-                mask = (df["Gender"] == gender) | df["Gender"].astype(str).str.contains(
-                    gender.name.replace("_", " ").title(), case=False, na=False
-                )
-                df = df[mask]
-
-        if characteristic:
-            char_cols = [col for col in df.columns if "characteristic" in col.lower()]
-            if char_cols:
-                col = char_cols[0]
-                # Filter by enum value directly or fallback to name matching
-                mask = (df[col] == characteristic) | df[col].astype(str).str.contains(
-                    characteristic.name.replace("_", " ").title(), case=False, na=False
-                )
-                df = df[mask]
-
-        if statistic_type:
-            stat_cols = [col for col in df.columns if "statistic" in col.lower()]
-            if stat_cols:
-                col = stat_cols[0]
-                # Filter by enum value directly or fallback to name matching
-                mask = (df[col] == statistic_type) | df[col].astype(str).str.contains(
-                    statistic_type.name.replace("_", " ").title(), case=False, na=False
-                )
-                df = df[mask]
+        # AND every filter's mask against the full frame, then slice once
+        mask: Optional[np.ndarray] = None
+        for enum_value, col in filters:
+            if enum_value and col is not None:
+                col_mask = self._enum_mask(df[col], enum_value)
+                mask = col_mask if mask is None else mask & col_mask
 
-        return df
+        return df if mask is None else df[mask]
+
+    @staticmethod
+    def _enum_mask(column: pd.Series, enum_value: Any) -> np.ndarray:
+        """
+        Rows equal to the enum value, or whose text contains its title-cased name.
+        For categorical columns the match is evaluated once per category and
+        broadcast to the rows through the category codes.
+        """
+        name = _enum_title(enum_value)
+        if isinstance(column.dtype, pd.CategoricalDtype):
+            categories = column.cat.categories
+            if categories.empty:
+                return np.zeros(len(column), dtype=bool)
+            category_match = np.asarray(categories == enum_value) | np.asarray(
+                categories.astype(str).str.contains(name, case=False, na=False)
+            )
+            codes = column.cat.codes.to_numpy()
+            return (codes >= 0) & category_match[codes]
+        # Filter by enum value directly or fallback to name matching
+        return np.asarray(
+            (column == enum_value)
+            | column.astype(str).str.contains(name, case=False, na=False)
+        )
 
     def compare_by_gender(self) -> pd.DataFrame:
         """Create a comparison table by gender for key characteristics."""
         df = self.dataframe
-        char_col = next(
-            (col for col in df.columns if "characteristic" in col.lower()), None
-        )
+        char_col = self._char_col
         gender_col = "Gender" if "Gender" in df.columns else None
 
         if char_col and gender_col and "value" in df.columns:
             # Get latest values only
             latest = (
-                df.loc[df.groupby(["series_key"])["time_period"].idxmax()]
+                df.loc[
+                    df.groupby(["series_key"], sort=False, observed=True)[
+                        "time_period"
+                    ].idxmax()
+                ]
                 if "time_period" in df.columns
                 else df
             )
 
             # Pivot to compare by gender
             comparison = latest.pivot_table(
-                index=char_col, columns=gender_col, values="value", aggfunc="first"
+                index=char_col,
+                columns=gender_col,
+                values="value",
+                aggfunc="first",
+                observed=True,
             )
 
             # Calculate gender ratio if both male and female are present
@@ -776,22 +861,29 @@ class CensusData:
 
         # Get latest values
         latest = (
-            df.loc[df.groupby(["series_key"])["time_period"].idxmax()]
+            df.loc[
+                df.groupby(["series_key"], sort=False, observed=True)[
+                    "time_period"
+                ].idxmax()
+            ]
             if "time_period" in df.columns
             else df
         )
 
         if by_value:
-            # Sort by value (handle NaN and non-numeric values)
-            numeric_mask = pd.to_numeric(latest["value"], errors="coerce").notna()
-            numeric_data = latest[numeric_mask].copy()
-            numeric_data["value_numeric"] = pd.to_numeric(numeric_data["value"])
-            top_data = numeric_data.nlargest(n, "value_numeric")
+            # Select the top n numeric values by position (Series.nlargest drops the
+            # NaN left by non-numeric values) so only those n rows are copied
+            top_values = (
+                pd.to_numeric(latest["value"], errors="coerce")
+                .reset_index(drop=True)
+                .nlargest(n)
+            )
+            top_data = latest.iloc[top_values.index].assign(
+                value_numeric=top_values.to_numpy()
+            )
         else:
             # Sort alphabetically by characteristic
-            char_col = next(
-                (col for col in df.columns if "characteristic" in col.lower()), None
-            )
+            char_col = self._char_col
             if char_col:
                 top_data = latest.sort_values(char_col).head(n)
             else:
@@ -823,34 +915,35 @@ class CensusData:
             Dictionary describing the dataset structure
         """
         df = self.dataframe
+        columns = df.columns
+
+        # Coerce the value column once and reuse it for every value statistic
+        value_stats: dict[str, Any] = {
+            "non_null_values": 0,
+            "numeric_values": 0,
+            "value_range": None,
+        }
+        if "value" in columns:
+            values = df["value"]
+            numeric = pd.to_numeric(values, errors="coerce")
+            value_stats = {
+                "non_null_values": values.count(),
+                "numeric_values": numeric.count(),
+                "value_range": {"min": numeric.min(), "max": numeric.max()},
+            }
 
         return {
             "total_rows": len(df),
             "total_series": df["series_key"].nunique()
-            if "series_key" in df.columns
+            if "series_key" in columns
             else 0,
             "time_periods": sorted(df["time_period"].unique())
-            if "time_period" in df.columns
+            if "time_period" in columns
             else [],
             "dimensions": {
                 name: len(dim_info.values) for name, dim_info in self.dimensions.items()
             },
-            "value_stats": {
-                "non_null_values": df["value"].count() if "value" in df.columns else 0,
-                "numeric_values": pd.to_numeric(df["value"], errors="coerce").count()
-                if "value" in df.columns
-                else 0,
-                "value_range": {
-                    "min": pd.to_numeric(df["value"], errors="coerce").min()
-                    if "value" in df.columns
-                    else None,
-                    "max": pd.to_numeric(df["value"], errors="coerce").max()
-                    if "value" in df.columns
-                    else None,
-                }
-                if "value" in df.columns
-                else None,
-            },
+            "value_stats": value_stats,
         }
 
     def get_population_summary(self) -> dict[str, Any]:
@@ -865,23 +958,30 @@ class CensusData:
             return {}
 
         # Get latest data for accurate population counts
-        latest_df = df.loc[df.groupby(["series_key"])["time_period"].idxmax()]
-
-        # Filter for total, male, and female populations
-        total_pop = latest_df[
-            latest_df["Gender"].str.contains("Total", case=False, na=False)
-        ]
-        male_pop = latest_df[
-            latest_df["Gender"].str.contains("Male", case=False, na=False)
-        ]
-        female_pop = latest_df[
-            latest_df["Gender"].str.contains("Female", case=False, na=False)
+        latest_df = df.loc[
+            df.groupby(["series_key"], sort=False, observed=True)[
+                "time_period"
+            ].idxmax()
         ]
 
-        # Calculate total population and male/female counts
-        total_population = total_pop["value"].sum() if not total_pop.empty else 0
-        male_population = male_pop["value"].sum() if not male_pop.empty else 0
-        female_population = female_pop["value"].sum() if not female_pop.empty else 0
+        # Classify each row as total, female or male in one pass ("female" is tested
+        # before "male" so female rows are not also counted as male)
+        gender = latest_df["Gender"].astype(str).str.lower()
+        kind = np.select(
+            [
+                gender.str.contains("total", regex=False),
+                gender.str.contains("female", regex=False),
+                gender.str.contains("male", regex=False),
+            ],
+            ["total", "female", "male"],
+            default="other",
+        )
+
+        # Calculate total population and male/female counts with a single grouped sum
+        sums = latest_df["value"].groupby(kind).sum()
+        total_population = sums.get("total", 0)
+        male_population = sums.get("male", 0)
+        female_population = sums.get("female", 0)
 
         # Calculate male to female ratio, avoid division by zero
         ratio = male_population / female_population if female_population > 0 else None
@@ -974,9 +1074,7 @@ class CensusData:
                 result["Gender"] = unique_genders
 
         # Check Characteristic column for enum values
-        char_cols = [col for col in df.columns if "characteristic" in col.lower()]
-        if char_cols:
-            col = char_cols[0]
+        if (col := self._char_col) is not None:
             unique_chars = [
                 val
                 for val in df[col].unique()
@@ -986,9 +1084,7 @@ class CensusData:
                 result["Characteristic"] = unique_chars
 
         # Check Statistic column for enum values
-        stat_cols = [col for col in df.columns if "statistic" in col.lower()]
-        if stat_cols:
-            col = stat_cols[0]
+        if (col := self._stat_col) is not None:
             unique_stats = [
                 val for val in df[col].unique() if isinstance(val, StatisticType)
             ]
@@ -1,8 +1,12 @@
+from collections.abc import Iterable
 from typing import Optional
 from dataclasses import dataclass
+import asyncio
 import pandas as pd
 import logging
 
+from httpx import AsyncClient
+
 from statscan.enums.schema import Schema
 from statscan.enums.vintage import Vintage
 from statscan.enums.frequency import Frequency
@@ -15,6 +19,8 @@ from statscan.sdmx.response import SDMXResponse
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_FETCH_CONCURRENCY = 16
+
 
 @dataclass
 class DGUID:
@@ -75,6 +81,7 @@ class DGUID:
         stats_filter: Optional[StatsFilter] = None,
         detail: Optional[Detail] = None,
         timeout: Optional[float] = None,
+        client: Optional[AsyncClient] = None,
     ) -> SDMXResponse:
         """
         Get data for the DGUID from the WDS API.
@@ -83,6 +90,7 @@ class DGUID:
             self (DGUID): The DGUID instance.
             frequency (Frequency, optional): The frequency of the data.
             stats_filter (StatsFilter, optional): The statistical filter to apply.
+            client (AsyncClient, optional): A shared client to reuse connections.
 
         Returns:
             Response: The API response containing the data.
@@ -95,6 +103,7 @@ class DGUID:
             format=Format.JSONDATA,
             detail=detail,
             timeout=timeout,
+            client=client,
         )
         raw_data = resp.json()
         sdmx_response = SDMXResponse.model_validate(obj=raw_data)
@@ -107,11 +116,15 @@ class DGUID:
         stats_filter: Optional[StatsFilter] = None,
         detail: Optional[Detail] = None,
         timeout: Optional[float] = None,
+        client: Optional[AsyncClient] = None,
         # raise_on_error: bool = False,
     ) -> None:
         """Update the cached SDMX response.
         Swallows exceptions by default (tests can proceed) but logs them.
         Set raise_on_error=True to propagate exceptions for debugging.
+
+        Pass an open `client` when updating many DGUIDs so they share one
+        connection pool; otherwise a short-lived client is created per call.
         """
         timeout = timeout or self.DEFAULT_TIMEOUT
         self._sdmx_response = await self._get_sdmx_response(
@@ -119,6 +132,7 @@ class DGUID:
             stats_filter=stats_filter,
             detail=detail,
             timeout=timeout,
+            client=client,
         )
         logger.debug(
             "Updated SDMX response for %s (flow=%s, freq=%s)",
@@ -392,3 +406,42 @@ class DGUID:
         """
         # This is a placeholder implementation - adjust based on actual API structure
         return f"https://www150.statcan.gc.ca/t1/wds/rest/getDataFromTable/sdmx/{self.data_flow}/{self}"
+
+
+async def fetch_many(
+    geocodes: Iterable[GeoCode],
+    vintage: Vintage = Vintage.CENSUS_2021,
+    *,
+    concurrency: int = DEFAULT_FETCH_CONCURRENCY,
+    timeout: Optional[float] = None,
+    client: Optional[AsyncClient] = None,
+) -> list[DGUID]:
+    """
+    Fetch SDMX data for many geographies concurrently.
+
+    All requests share one HTTP client and at most `concurrency` are in flight at once.
+
+    Args:
+        geocodes: The geographies to fetch.
+        vintage: The census vintage for every DGUID.
+        concurrency: Maximum number of simultaneous requests.
+        timeout: Request timeout in seconds (defaults to DGUID.DEFAULT_TIMEOUT).
+        client: An open client to reuse; a temporary one is created if omitted.
+
+    Returns:
+        The updated DGUIDs, in the same order as `geocodes`.
+    """
+    sem = asyncio.Semaphore(concurrency)
+
+    async def fetch_one(geocode: GeoCode, shared: AsyncClient) -> DGUID:
+        dguid = DGUID(geocode=geocode, vintage=vintage)
+        async with sem:
+            await dguid.update(timeout=timeout, client=shared)
+        return dguid
+
+    if client is not None:
+        return list(await asyncio.gather(*(fetch_one(g, client) for g in geocodes)))
+    async with AsyncClient() as new_client:
+        return list(
+            await asyncio.gather(*(fetch_one(g, new_client) for g in geocodes))
+        )
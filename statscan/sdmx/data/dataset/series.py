@@ -1,3 +1,4 @@
+from operator import itemgetter
 from typing import Optional, Any
 
 from pydantic import field_validator
@@ -63,8 +64,8 @@ class Series(Base):
         """Get the latest observation (highest period key)."""
         if not self.observations:
             return None
-        latest_period = max(self.observations.keys())
-        return latest_period, self.observations[latest_period]
+        # single pass over the items; no second dict lookup for the values
+        return max(self.observations.items(), key=itemgetter(0))
 
     def get_earliest_observation(
         self,
@@ -72,8 +73,7 @@ class Series(Base):
         """Get the earliest observation (lowest period key)."""
         if not self.observations:
             return None
-        earliest_period = min(self.observations.keys())
-        return earliest_period, self.observations[earliest_period]
+        return min(self.observations.items(), key=itemgetter(0))
 
     def get_non_null_observations(self) -> dict[int, list[Optional[float | int]]]:
         """Get observations that contain at least one non-null value."""
@@ -28,6 +28,7 @@ class SDMXResponse(Base):
     data: Data
     errors: list = []
     _raw_data: Optional[dict[str, Any]] = None
+    _dataframe: Optional[pd.DataFrame] = None  # Cached standardized DataFrame
 
     @property
     def structures(self) -> list[Structure]:
@@ -265,10 +266,15 @@ class SDMXResponse(Base):
         """
         Get the response data as a pandas DataFrame.
 
+        The DataFrame is built on first access and cached, since every filter
+        helper starts from it; copy it before modifying it in place.
+
         Returns:
             DataFrame representation of the SDMX response
         """
-        return self.to_dataframe().pipe(self._standardize_dataframe)
+        if self._dataframe is None:
+            self._dataframe = self.to_dataframe().pipe(self._standardize_dataframe)
+        return self._dataframe
 
     # --- New helper methods ---
     def _standardize_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
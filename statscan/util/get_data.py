@@ -171,6 +171,7 @@ async def get_sdmx_data(
     parameters: Optional[dict[str, Any]] = None,
     timeout: Optional[float] = None,
     client_kwargs: Optional[dict[str, Any]] = None,
+    client: Optional[AsyncClient] = None,
 ) -> Response:
     """
     Get SDMX data from the Census Profile SDMX API.
@@ -188,6 +189,11 @@ async def get_sdmx_data(
         parameters (dict, optional): Additional query parameters.
         timeout (float, optional): Request timeout in seconds.
         client_kwargs (dict, optional): Additional arguments for the HTTP client.
+            Ignored when `client` is provided.
+        client (AsyncClient, optional): An open client to send the request with.
+            Share one client across repeated calls so its connection pool is reused
+            (one client per application lifetime) instead of paying a new TCP/TLS
+            handshake for every request.
 
     Returns:
         Response: The HTTP response containing SDMX data.
@@ -225,15 +231,20 @@ async def get_sdmx_data(
         if p is not None:
             parameters = p.add_to_params(parameters)
 
-    client_kwargs = client_kwargs or {}
-    if timeout is not None:
-        client_kwargs["timeout"] = timeout
-
     logger.debug(
         f"Fetching Census Profile SDMX data from {url} with parameters {parameters}"
     )
-    async with AsyncClient(**client_kwargs) as client:  # type: ignore[arg-type]
-        response = await client.get(url, params=parameters)
+    if client is not None:
+        request_kwargs: dict[str, Any] = {}
+        if timeout is not None:
+            request_kwargs["timeout"] = timeout
+        response = await client.get(url, params=parameters, **request_kwargs)
+    else:
+        client_kwargs = client_kwargs or {}
+        if timeout is not None:
+            client_kwargs["timeout"] = timeout
+        async with AsyncClient(**client_kwargs) as new_client:  # type: ignore[arg-type]
+            response = await new_client.get(url, params=parameters)
     response.raise_for_status()
     return response
 
@@ -15,6 +15,10 @@ from typing import (
 from httpx._client import AsyncClient, Response
 from pydantic import BaseModel
 
+try:
+    from orjson import loads as _json_loads  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    from json import loads as _json_loads
 
 P = ParamSpec("P")
 _T = TypeVar("_T", bound=BaseModel)
@@ -79,7 +83,9 @@ class WDSRequests:
         resp = await coro
         resp.raise_for_status()
 
-        data = resp.json()
+        # parse the raw body directly; orjson (when installed) is much faster on
+        # large WDS payloads than httpx's stdlib-backed Response.json()
+        data = _json_loads(resp.content)
         logger.debug(f"Response code: {resp.status_code}, Response JSON: {data}")
 
         if model:
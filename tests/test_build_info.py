@@ -0,0 +1,228 @@
+import os
+import subprocess  # nosec B404
+import sys
+from dataclasses import replace
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+
+import build_info
+from build_info import BuildInfo, GitHubActionEnvVars
+
+BUILD_INFO_SCRIPT = Path(build_info.__file__)
+BUILD_TIME = datetime(2024, 5, 6, 7, 8, 9, tzinfo=UTC)
+NEW_BUILD_TIME = datetime(2024, 5, 7, 10, 11, 12, tzinfo=UTC)
+
+
+@pytest.fixture(autouse=True)
+def _clear_caches():
+    build_info.clear_caches()
+    yield
+    build_info.clear_caches()
+
+
+@pytest.fixture
+def version_file(tmp_path: Path) -> Path:
+    """A version file written for a known commit, branch and build time."""
+    path = tmp_path / build_info.DEFAULT_VERSION_FILE_NAME
+    BuildInfo(
+        repo_path=tmp_path, build_time=BUILD_TIME, commit="abc123", branch="main"
+    ).write_version_file(path)
+    return path
+
+
+def _read(path: Path) -> dict:
+    st = path.stat()
+    return build_info._read_version_file(path.resolve(), st.st_mtime_ns, st.st_size)
+
+
+class TestVersionFile:
+    def test_parses_typed_values(self, version_file: Path) -> None:
+        """Each `__name__: type = 'value'` line is parsed to its declared type."""
+        version_file.write_text(
+            version_file.read_text()
+            + "__build__: int = '7'\n__ratio__: float = '0.5'\n__dirty__: bool = 'False'\n"
+        )
+        values = _read(version_file)
+        assert values["version"] == "2024.5.6.070809"
+        assert values["commit"] == "abc123"
+        assert values["branch"] == "main"
+        assert values["build_time"] == BUILD_TIME.isoformat()
+        assert (values["build"], values["ratio"], values["dirty"]) == (7, 0.5, False)
+
+    def test_cached_until_file_changes(self, version_file: Path) -> None:
+        """Reads are cached on the stat signature; rewriting the file invalidates them."""
+        first = _read(version_file)
+        assert _read(version_file) is first
+
+        version_file.write_text(version_file.read_text().replace("abc123", "def456"))
+        os.utime(version_file, ns=(0, version_file.stat().st_mtime_ns + 1))
+        assert _read(version_file) is not first
+        assert BuildInfo.from_version_file(version_file).commit == "def456"
+
+    def test_from_version_file_round_trip(self, version_file: Path) -> None:
+        """Loading a written file restores every stored field with its type."""
+        bi = BuildInfo.from_version_file(version_file)
+        assert (bi.commit, bi.branch, bi.build_time) == ("abc123", "main", BUILD_TIME)
+        assert bi.version == "2024.5.6.070809"
+        assert bi.repo_path == version_file.parent
+
+    def test_write_reports_whether_it_wrote(self, version_file: Path) -> None:
+        """Identical content is not rewritten (and the mtime is kept)."""
+        mtime = version_file.stat().st_mtime_ns
+        bi = BuildInfo.from_version_file(version_file)
+        assert bi.write_version_file(version_file) is False
+        assert version_file.stat().st_mtime_ns == mtime
+
+        bi = replace(bi, build_time=NEW_BUILD_TIME)
+        assert bi.write_version_file(version_file) is True
+        rewritten = BuildInfo.from_version_file(version_file)
+        assert (rewritten.build_time, rewritten.version) == (NEW_BUILD_TIME, bi.version)
+
+
+class TestUpdateVersionFile:
+    def test_same_commit_is_not_updated(self, version_file: Path) -> None:
+        bi = BuildInfo(
+            repo_path=version_file.parent,
+            build_time=NEW_BUILD_TIME,
+            commit="abc123",
+            branch="main",
+        )
+        assert bi.update_version_file(version_file) is False
+        assert BuildInfo.from_version_file(version_file).build_time == BUILD_TIME
+
+    def test_force_rewrites_same_commit(self, version_file: Path) -> None:
+        bi = BuildInfo(
+            repo_path=version_file.parent,
+            build_time=NEW_BUILD_TIME,
+            commit="abc123",
+            branch="main",
+        )
+        assert bi.update_version_file(version_file, force=True) is True
+        assert BuildInfo.from_version_file(version_file).build_time == NEW_BUILD_TIME
+
+    def test_force_with_identical_content_reports_no_change(
+        self, version_file: Path
+    ) -> None:
+        bi = BuildInfo.from_version_file(version_file)
+        assert bi.update_version_file(version_file, force=True) is False
+
+    def test_new_commit_is_updated(self, version_file: Path) -> None:
+        bi = BuildInfo(
+            repo_path=version_file.parent,
+            build_time=BUILD_TIME,
+            commit="def456",
+            branch="main",
+        )
+        assert bi.update_version_file(version_file) is True
+        assert BuildInfo.from_version_file(version_file).commit == "def456"
+
+
+class TestUpdateCli:
+    @staticmethod
+    def _update(version_file: Path, *args: str) -> str:
+        result = subprocess.run(  # nosec B603
+            [
+                sys.executable,
+                str(BUILD_INFO_SCRIPT),
+                str(version_file.parent),
+                "-u",
+                "-t",
+                NEW_BUILD_TIME.isoformat(),
+                "-p",
+                "build_time",
+                *args,
+            ],
+            capture_output=True,
+            check=True,
+            text=True,
+        )
+        return result.stdout.strip()
+
+    def test_update_without_force_keeps_file(self, version_file: Path) -> None:
+        self._update(version_file)
+        assert BuildInfo.from_version_file(version_file).build_time == BUILD_TIME
+
+    def test_update_with_force_rewrites_file(self, version_file: Path) -> None:
+        assert self._update(version_file, "--force") == str(NEW_BUILD_TIME)
+        assert BuildInfo.from_version_file(version_file).build_time == NEW_BUILD_TIME
+        assert build_info.get_version_str(dt=NEW_BUILD_TIME) in version_file.read_text()
+
+
+class TestGetCommitHash:
+    @staticmethod
+    def _repo(tmp_path: Path, head: str) -> Path:
+        git_path = tmp_path / ".git"
+        (git_path / "refs" / "heads").mkdir(parents=True)
+        (git_path / "HEAD").write_text(head)
+        return tmp_path
+
+    def test_reads_loose_ref_files(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A branch with a loose ref file is read without running git."""
+        repo = self._repo(tmp_path, "ref: refs/heads/main\n")
+        (repo / ".git" / "refs" / "heads" / "main").write_text("abc123\n")
+
+        def fail(**_):
+            raise AssertionError("git should not be run")
+
+        monkeypatch.setattr(build_info, "_from_git_cmd", fail)
+        assert build_info.get_commit_hash(repo) == ("main", "abc123")
+
+    @pytest.mark.parametrize(
+        "head",
+        ["ref: refs/heads/packed\n", "0123456789abcdef\n"],
+        ids=["packed", "detached"],
+    )
+    def test_falls_back_to_git_cmd(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, head: str
+    ) -> None:
+        """Packed refs and a detached HEAD are resolved with git rev-parse."""
+        repo = self._repo(tmp_path, head)
+        monkeypatch.setattr(
+            build_info, "_from_git_cmd", lambda repo_path: ("HEAD", "gitsha")
+        )
+        assert build_info.get_commit_hash(repo) == ("HEAD", "gitsha")
+
+    def test_missing_repository(self, tmp_path: Path) -> None:
+        with pytest.raises(FileNotFoundError):
+            build_info.get_commit_hash(tmp_path)
+
+
+class TestResolveCommit:
+    def test_prefers_github_environment(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """With GITHUB_REF and GITHUB_SHA set, git is never consulted."""
+        monkeypatch.setenv(GitHubActionEnvVars.GITHUB_REF, "refs/heads/release")
+        monkeypatch.setenv(GitHubActionEnvVars.GITHUB_SHA, "0123abcd")
+
+        def fail(**_):
+            raise AssertionError("git should not be read")
+
+        monkeypatch.setattr(build_info, "get_commit_hash", fail)
+        assert build_info.resolve_commit() == ("refs/heads/release", "0123abcd")
+
+    @pytest.mark.parametrize(
+        ("env", "expected"),
+        [
+            ({}, ("main", "gitsha")),
+            ({"GITHUB_REF": "refs/heads/ci"}, ("refs/heads/ci", "gitsha")),
+            ({"GITHUB_SHA": "envsha"}, ("main", "envsha")),
+        ],
+    )
+    def test_falls_back_to_git(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        env: dict[str, str],
+        expected: tuple[str, str],
+    ) -> None:
+        """Whatever the environment does not provide is read from git."""
+        for var in (GitHubActionEnvVars.GITHUB_REF, GitHubActionEnvVars.GITHUB_SHA):
+            monkeypatch.delenv(var, raising=False)
+        for name, value in env.items():
+            monkeypatch.setenv(name, value)
+        monkeypatch.setattr(
+            build_info, "get_commit_hash", lambda repo_path=None: ("main", "gitsha")
+        )
+        assert build_info.resolve_commit() == expected
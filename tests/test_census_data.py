@@ -0,0 +1,156 @@
+import warnings
+from dataclasses import asdict
+
+import pandas as pd
+
+from statscan.enums.stats_filter import Gender, StatisticType, StatsFilter
+
+with warnings.catch_warnings():
+    warnings.simplefilter("ignore", DeprecationWarning)
+    from statscan.census_data import CensusData, DimensionInfo, SeriesInfo
+
+
+def _census_data(**dimensions: list[str]) -> CensusData:
+    """CensusData with one observation per series and the given dimension columns."""
+    n = len(next(iter(dimensions.values())))
+    df = pd.DataFrame(
+        {
+            **dimensions,
+            "series_key": [f"0:{i}" for i in range(n)],
+            "time_period": ["2021"] * n,
+            "value": [float(i) for i in range(n)],
+        }
+    )
+    return CensusData(df)
+
+
+# Two-dimension structure used to decode series keys
+_DIMENSIONS = {
+    "Geography": DimensionInfo(
+        id="geography",
+        name="Geography",
+        values=[{"id": "0", "name": "Canada"}, {"id": "1", "name": "Ontario"}],
+    ),
+    "Gender": DimensionInfo(
+        id="gender",
+        name="Gender",
+        values=[{"id": "0", "name": "Total - Gender"}, {"id": "1", "name": "Men"}],
+    ),
+}
+
+
+class TestFilterByEnhancedFilter:
+    def test_matches_present_dimension(self) -> None:
+        """Series whose dimension value contains the enum name are kept."""
+        data = _census_data(Gender=["Total Gender", "Men+", "Women+"])
+        series = data.filter_by_enhanced_filter(StatsFilter(gender=Gender.TOTAL_GENDER))
+        assert [s.key for s in series] == ["0:0"]
+
+    def test_missing_gender_column_matches_nothing(self) -> None:
+        """A gender filter on data without a Gender column matches no series."""
+        data = _census_data(Geography=["Canada", "Ontario"])
+        assert data.filter_by_enhanced_filter(StatsFilter(gender=Gender.MALE)) == []
+
+    def test_missing_statistic_column_matches_nothing(self) -> None:
+        """A statistic filter on data without a statistic column matches no series."""
+        data = _census_data(Gender=["Total - Gender", "Men+"])
+        stats_filter = StatsFilter(
+            gender=Gender.TOTAL_GENDER, statistic_type=StatisticType.COUNT
+        )
+        assert data.filter_by_enhanced_filter(stats_filter) == []
+
+    def test_empty_filter_keeps_every_series(self) -> None:
+        """A filter with no criteria keeps all series."""
+        data = _census_data(Geography=["Canada", "Ontario"])
+        assert len(data.filter_by_enhanced_filter(StatsFilter())) == 2
+
+
+class TestExactFilters:
+    def test_filter_by_gender_exact(self) -> None:
+        """exact=True keeps only equal values instead of substring matches."""
+        data = _census_data(Gender=["Male", "Female", "Male"])
+        assert len(data.filter_by_gender("male")) == 3
+        assert data.filter_by_gender("Male", exact=True)["value"].tolist() == [0.0, 2.0]
+
+    def test_filter_by_characteristic_exact(self) -> None:
+        """exact=True ignores longer characteristic names containing the value."""
+        data = _census_data(
+            Characteristic=["Population", "Population density", "Median age"]
+        )
+        assert len(data.filter_by_characteristic("population")) == 2
+        exact = data.filter_by_characteristic("Population", exact=True)
+        assert exact["Characteristic"].tolist() == ["Population"]
+
+    def test_exact_on_categorical_column(self) -> None:
+        """Exact filters also work once the dimension columns are categorical."""
+        data = _census_data(Gender=["Male", "Female"])
+        data._dataframe = data.dataframe.astype({"Gender": "category"})
+        assert data.filter_by_gender("Female", exact=True)["value"].tolist() == [1.0]
+        assert data.filter_by_gender("Missing", exact=True).empty
+
+
+class TestDecodeSeriesKeys:
+    def test_matches_per_key_decoding(self) -> None:
+        """The batched decoder agrees with decoding each key separately."""
+        keys = ["0:0", "1:1", "1:0"]
+        decoded = CensusData._decode_series_keys(keys, _DIMENSIONS)
+        assert decoded == [CensusData._decode_series_key(k, _DIMENSIONS) for k in keys]
+        assert decoded[1] == {"Geography": "Ontario", "Gender": Gender.MALE}
+        assert decoded[0]["Gender"] is Gender.TOTAL_GENDER
+
+    def test_falls_back_for_irregular_keys(self) -> None:
+        """Ragged, non-integer and out-of-range keys decode like the per-key path."""
+        for keys in (["0:0", "1"], ["0:x"], ["0:5"]):
+            assert CensusData._decode_series_keys(keys, _DIMENSIONS) == [
+                CensusData._decode_series_key(k, _DIMENSIONS) for k in keys
+            ]
+
+    def test_empty_keys(self) -> None:
+        """No keys decode to no rows."""
+        assert CensusData._decode_series_keys([], _DIMENSIONS) == []
+
+
+class TestCreateDataFrame:
+    def test_dimension_columns_are_categorical(self) -> None:
+        """Dimension, key-component and series_key columns are categorical."""
+        series = [
+            SeriesInfo(
+                key="0:0",
+                dimensions={"Geography": "Canada"},
+                observations={"2021": 1.0, "2016": 2.0},
+            ),
+            SeriesInfo(
+                key="1:0",
+                dimensions={"Geography": "Ontario", "Gender": "Men+"},
+                observations={"2021": 3.0},
+            ),
+        ]
+        df = CensusData._create_dataframe(series)
+
+        assert list(df.columns) == [
+            "Geography",
+            "Gender",
+            "dimension_0",
+            "dimension_1",
+            "series_key",
+            "time_period",
+            "value",
+        ]
+        for col in ("Geography", "Gender", "dimension_0", "dimension_1", "series_key"):
+            assert isinstance(df[col].dtype, pd.CategoricalDtype), col
+        assert not isinstance(df["value"].dtype, pd.CategoricalDtype)
+        assert df["Geography"].tolist() == ["Canada", "Canada", "Ontario"]
+        assert df["Gender"].isna().tolist() == [True, True, False]
+        assert df["value"].tolist() == [1.0, 2.0, 3.0]
+
+
+class TestSeriesInfo:
+    def test_dimensions_lower(self) -> None:
+        """Lower-cased dimensions are derived on demand, not stored on the instance."""
+        series = SeriesInfo(key="0", dimensions={"Gender": "Men+"}, observations={})
+        assert series.dimensions_lower == {"Gender": "men+"}
+        assert asdict(series) == {
+            "key": "0",
+            "dimensions": {"Gender": "Men+"},
+            "observations": {},
+        }
@@ -0,0 +1,101 @@
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+from httpx import AsyncClient, HTTPStatusError, MockTransport, Request, Response
+
+import statscan.dguid
+from statscan.dguid import DGUID, fetch_many
+from statscan.enums.auto.census_division import CensusDivision
+
+SDMX_RESPONSE_PATH = Path(__file__).parent / "data" / "sdmx" / "sdmx_response.json"
+
+GEOCODES = list(CensusDivision)[:5]
+
+
+@pytest.fixture(scope="module")
+def sdmx_content() -> bytes:
+    """The stored SDMX response, trimmed to a couple of series to keep parsing fast."""
+    data = json.loads(SDMX_RESPONSE_PATH.read_text())
+    dataset = data["data"]["dataSets"][0]
+    dataset["series"] = dict(list(dataset["series"].items())[:2])
+    dataset["annotations"] = []
+    data["data"]["structures"][0]["annotations"] = []
+    return json.dumps(data).encode("utf-8")
+
+
+class TestFetchMany:
+    @pytest.mark.asyncio
+    async def test_uses_injected_client(self, sdmx_content: bytes) -> None:
+        """Every request goes through the given client, which is left open."""
+        requested: list[str] = []
+
+        def handler(request: Request) -> Response:
+            requested.append(request.url.path.rsplit("/data/", 1)[1])
+            return Response(200, content=sdmx_content)
+
+        async with AsyncClient(transport=MockTransport(handler)) as client:
+            dguids = await fetch_many(GEOCODES, client=client)
+            assert not client.is_closed
+
+        assert [d.geocode for d in dguids] == GEOCODES
+        assert all(d.sdmx_response is not None for d in dguids)
+        assert sorted(requested) == sorted(f"{d.data_flow}/{d.key()}" for d in dguids)
+
+    @pytest.mark.asyncio
+    async def test_limits_concurrency(self, sdmx_content: bytes) -> None:
+        """No more than `concurrency` requests are in flight at once."""
+        in_flight = peak = 0
+
+        async def handler(request: Request) -> Response:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return Response(200, content=sdmx_content)
+
+        async with AsyncClient(transport=MockTransport(handler)) as client:
+            await fetch_many(GEOCODES, concurrency=2, client=client)
+
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_shares_one_temporary_client(
+        self, sdmx_content: bytes, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Without a client, one temporary client serves every request and is closed."""
+        clients: list[AsyncClient] = []
+
+        def make_client() -> AsyncClient:
+            client = AsyncClient(
+                transport=MockTransport(lambda _: Response(200, content=sdmx_content))
+            )
+            clients.append(client)
+            return client
+
+        monkeypatch.setattr(statscan.dguid, "AsyncClient", make_client)
+        dguids = await fetch_many(GEOCODES)
+
+        assert len(clients) == 1 and clients[0].is_closed
+        assert [d.geocode for d in dguids] == GEOCODES
+
+    @pytest.mark.asyncio
+    async def test_propagates_http_errors(self) -> None:
+        """A failed request raises instead of returning a partially updated list."""
+        transport = MockTransport(lambda _: Response(500))
+        async with AsyncClient(transport=transport) as client:
+            with pytest.raises(HTTPStatusError):
+                await fetch_many(GEOCODES[:1], client=client)
+
+
+class TestDGUIDUpdate:
+    @pytest.mark.asyncio
+    async def test_update_with_client(self, sdmx_content: bytes) -> None:
+        """update() sends its request through the given client."""
+        transport = MockTransport(lambda _: Response(200, content=sdmx_content))
+        dguid = DGUID(geocode=GEOCODES[0])
+        async with AsyncClient(transport=transport) as client:
+            await dguid.update(client=client)
+        assert dguid.sdmx_response is not None